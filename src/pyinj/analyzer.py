@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from typing import Any, Optional, Type, get_type_hints
 
+from pyinj.tokens import Scope, Token
+
 
 def analyze_dependencies(cls: Type[Any]) -> dict[str, Type[Any]]:
     """Analyze class constructor dependencies.
@@ -46,8 +48,6 @@ def get_token_metadata(cls: Type[Any]) -> tuple[str, Any]:
     Returns:
         Tuple of (token_name, scope)
     """
-    from pyinj.tokens import Scope
-
     token_name = getattr(cls, "__token_name__", cls.__name__.lower())
     scope = getattr(cls, "__scope__", Scope.TRANSIENT)
 
@@ -75,8 +75,6 @@ def extract_type_from_token(token: Any) -> Optional[Type[Any]]:
     Returns:
         The type if token is a Token[T], None otherwise
     """
-    from pyinj.tokens import Token
-
     if isinstance(token, Token):
         # Token.type_ is always a Type[Any]
         return getattr(token, 'type_', None)
@@ -3,22 +3,22 @@
 from __future__ import annotations
 
 import asyncio
+import inspect
 import threading
-from collections import deque
 from collections.abc import Callable, Iterator
-from contextlib import contextmanager
+from contextlib import contextmanager, nullcontext
 from contextvars import ContextVar
 from contextvars import Token as CtxToken
 from dataclasses import dataclass
 from enum import Enum, auto
-from functools import lru_cache
-from itertools import groupby
+from functools import partial
 from types import MappingProxyType, TracebackType
 from typing import (
     Any,
     AsyncContextManager,
     Awaitable,
     ContextManager,
+    Final,
     Generic,
     Literal,
     Mapping,
@@ -34,6 +34,7 @@ from .exceptions import (
     CircularDependencyError,
     ResolutionError,
 )
+from .injection import inject as _inject
 from .metaclasses import Injectable
 from .protocols.resources import SupportsAsyncClose, SupportsClose
 from .tokens import Scope, Token, TokenFactory
@@ -51,20 +52,117 @@ class CleanupMode(Enum):
     CONTEXT_ASYNC = auto()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _Registration(Generic[T]):
     provider: Callable[[], Any]
     cleanup: CleanupMode
+    # Effective scope, fixed at registration so resolution needn't recompute it
+    scope: Scope
+    # Whether the provider is a coroutine function, classified once
+    is_async: bool = False
 
 
+class _OverrideNode:
+    """One layer of overrides, linked to the layer it shadows.
+
+    Pushing a layer is O(1); nothing is copied from the parent chain.
+    """
+
+    __slots__ = ("entries", "parent")
+
+    def __init__(
+        self,
+        entries: Mapping[Token[object], object],
+        parent: _OverrideNode | None,
+    ) -> None:
+        self.entries = entries
+        self.parent = parent
+
+
+class _OverrideScope:
+    """Context manager returned by :meth:`Container.use_overrides`."""
+
+    __slots__ = ("_container", "_new", "_reset")
+
+    def __init__(
+        self, container: Container, new: Mapping[Token[object], object]
+    ) -> None:
+        self._container = container
+        self._new = new
+        self._reset: CtxToken[_OverrideNode | None] | None = None
+
+    def __enter__(self) -> None:
+        container = self._container
+        container._has_overrides = True
+        overrides = container._overrides
+        self._reset = overrides.set(_OverrideNode(self._new, overrides.get()))
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        if self._reset is not None:
+            self._container._overrides.reset(self._reset)
+            self._reset = None
+
+
+class _ResolutionFrame:
+    """One link of the task-local resolution stack.
+
+    Pushing a token allocates a single frame pointing at its caller, so a
+    nested resolve costs O(1) instead of copying the whole stack. Frames are
+    never mutated, which keeps stacks inherited by child asyncio tasks
+    independent of each other. ``mask`` is a 64-bit Bloom filter over the
+    token hashes in the chain, so the usual "not a cycle" answer needs no walk.
+    """
+
+    __slots__ = ("token", "parent", "depth", "mask")
+
+    def __init__(
+        self, token: Token[Any] | None, parent: _ResolutionFrame | None
+    ) -> None:
+        self.token = token
+        self.parent = parent
+        if parent is None:
+            self.depth = 0
+            self.mask = 0
+        else:
+            self.depth = parent.depth + 1
+            self.mask = parent.mask | (1 << (hash(token) & 63))
+
+    def __len__(self) -> int:
+        return self.depth
+
+    def __contains__(self, token: object) -> bool:
+        if not self.mask & (1 << (hash(token) & 63)):
+            return False
+        frame = self
+        while frame.parent is not None:
+            if frame.token == token:
+                return True
+            frame = frame.parent
+        return False
+
+    def __iter__(self) -> Iterator[Token[Any]]:
+        """Yield tokens outermost first, matching resolution order."""
+        tokens: list[Token[Any]] = []
+        frame = self
+        while frame.parent is not None:
+            tokens.append(cast(Token[Any], frame.token))
+            frame = frame.parent
+        return reversed(tokens)
+
+
+_EMPTY_FRAME = _ResolutionFrame(None, None)
+
 # Task-local resolution stack to avoid false circular detection across asyncio tasks
-_resolution_stack: ContextVar[tuple[Token[Any], ...]] = ContextVar(
-    "pyinj_resolution_stack", default=()
-)
-# Set for O(1) cycle detection
-_resolution_set: ContextVar[set[Token[Any]]] = ContextVar(
-    "pyinj_resolution_set", default=set()
+_resolution_stack: ContextVar[_ResolutionFrame] = ContextVar(
+    "pyinj_resolution_stack", default=_EMPTY_FRAME
 )
+# Cache-miss sentinel so that ``None`` can be a legitimately cached value
+_MISSING: Final = object()
 
 
 class Container(ContextualContainer):
@@ -87,31 +185,90 @@ class Container(ContextualContainer):
             logger.info("hello")
     """
 
-    def __init__(self) -> None:
-        """Initialize container."""
+    # Slots shared with ContextualContainer are declared there
+    __slots__ = (
+        "tokens",
+        "_given_providers",
+        "_given_cache",
+        "_registrations",
+        "_token_scopes",
+        "_inflight",
+        "_cache_hits",
+        "_cache_misses",
+        "_lock",
+        "_singleton_locks",
+        "_idempotent",
+        "_overrides",
+        "_has_overrides",
+        "_overrides_get",
+        "_singletons_get",
+        "_providers_get",
+        "_registrations_get",
+        "_providers_view",
+        "_resources_snapshot",
+        "_type_index",
+        "_resolve_keys",
+        "_validated_types",
+        "_singleton_cleanup_sync",
+        "_singleton_cleanup_async",
+    )
+
+    def __init__(self, *, thread_safe: bool = True) -> None:
+        """Initialize container.
+
+        Args:
+            thread_safe: Guard registry mutations with a re-entrant lock. Pass
+                ``False`` for single-threaded setups (tests, scripts) to skip
+                lock acquisition on registration and cleanup.
+        """
         super().__init__()
 
         self.tokens: TokenFactory = TokenFactory()
         self._given_providers: dict[type[object], ProviderSync[object]] = {}
+        # MRO lookups memoized per requested type; ``None`` records a miss
+        self._given_cache: dict[type[object], ProviderSync[object] | None] = {}
         self._providers: dict[Token[object], ProviderLike[object]] = {}
         self._registrations: dict[Token[object], _Registration[object]] = {}
         self._token_scopes: dict[Token[object], Scope] = {}
         self._singletons: dict[Token[object], object] = {}
-        self._async_locks: dict[Token[object], asyncio.Lock] = {}
+        self._inflight: dict[Token[object], asyncio.Future[object]] = {}
 
-        self._resolution_times: deque[float] = deque(maxlen=1000)
         self._cache_hits: int = 0
         self._cache_misses: int = 0
 
-        self._lock: threading.RLock = threading.RLock()
+        self._lock: ContextManager[Any] = (
+            threading.RLock() if thread_safe else nullcontext()
+        )
         self._singleton_locks: dict[Token[object], threading.Lock] = {}
+        self._idempotent: set[Token[object]] = set()
 
-        self._overrides: ContextVar[dict[Token[object], object] | None] = ContextVar(
+        self._overrides: ContextVar[_OverrideNode | None] = ContextVar(
             "pyinj_overrides",
             default=None,
         )
+        # Set on first use and never cleared: until some context installs an
+        # override, resolution can skip the ContextVar read entirely
+        self._has_overrides: bool = False
+
+        # Bound lookups for the resolution hot path; the underlying dicts are
+        # only ever mutated in place, never reassigned
+        self._overrides_get = self._overrides.get
+        self._singletons_get = self._singletons.get
+        self._providers_get = self._providers.get
+        self._registrations_get = self._registrations.get
+        # A proxy tracks its dict live, so one instance serves every caller
+        self._providers_view = MappingProxyType(self._providers)
+        # Rebuilt lazily after a new resource is tracked
+        self._resources_snapshot: (
+            tuple[SupportsClose | SupportsAsyncClose, ...] | None
+        ) = None
 
         self._type_index: dict[type[object], Token[object]] = {}
+        # get()/aget() key (type or token) -> canonical registered token;
+        # cleared whenever a registration is added
+        self._resolve_keys: dict[object, Token[object]] = {}
+        # Last concrete type each token's provider returned and that validated
+        self._validated_types: dict[Token[Any], type[object]] = {}
         self._singleton_cleanup_sync: list[Callable[[], None]] = []
         self._singleton_cleanup_async: list[Callable[[], Awaitable[None]]] = []
 
@@ -184,71 +341,38 @@ class Container(ContextualContainer):
         Returns:
             An existing token if found, otherwise a new token
         """
-        # Fast path: check type index
-        obj_cls = cast(type[object], cls)
-        found = self._type_index.get(obj_cls)
+        # Every registration path indexes its token by type
+        found = self._type_index.get(cast(type[object], cls))
         if found is not None:
             return cast(Token[U], found)
 
-        # Check registered providers and singletons
-        token = self._search_for_token_by_type(cls)
-        if token is not None:
-            return token
-
         # Create new token as fallback
         return Token(cls.__name__, cls)
 
-    def _search_for_token_by_type(self, cls: type[U]) -> Token[U] | None:
-        """Search for a token matching the given type.
-
-        Args:
-            cls: The type to search for
-
-        Returns:
-            The matching token if found, None otherwise
-        """
-        # Search in providers
-        for registered in self._providers:
-            if registered.type_ == cls:
-                return cast(Token[U], registered)
-
-        # Search in singletons
-        for registered in self._singletons:
-            if registered.type_ == cls:
-                return cast(Token[U], registered)
-
-        return None
-
     def _get_override(self, token: Token[U]) -> U | None:
-        current = self._overrides.get()
-        if current is not None:
-            val = current.get(cast(Token[object], token))
-            if val is not None:
-                return cast(U, val)
+        if not self._has_overrides:
+            return None
+        node = self._overrides_get()
+        # Innermost layer wins; walk outwards until the token is found
+        while node is not None:
+            entries = node.entries
+            if token in entries:
+                return cast(U | None, entries[cast(Token[object], token)])
+            node = node.parent
         return None
 
     @contextmanager
     def _resolution_guard(self, token: Token[Any]):
-        """Guard against circular dependencies with O(1) cycle detection using sets."""
-        # Why is resoultion set global on the top of the module ?
-        # Am I missing something here and not undertanding the code properly?
-        resolution_set = _resolution_set.get()
-        # O(1) lookup for cycle detection
-        if token in resolution_set:
-            # Get stack for error reporting
-            stack = _resolution_stack.get()
+        """Guard against circular dependencies along the current resolution chain."""
+        stack = _resolution_stack.get()
+        if token in stack:
             raise CircularDependencyError(token, list(stack))
 
-        new_set = resolution_set | {token}
-        new_stack = (*_resolution_stack.get(), token)
-
-        reset_set = _resolution_set.set(new_set)
-        reset_stack = _resolution_stack.set(new_stack)
+        reset = _resolution_stack.set(_ResolutionFrame(token, stack))
         try:
             yield
         finally:
-            _resolution_set.reset(reset_set)
-            _resolution_stack.reset(reset_stack)
+            _resolution_stack.reset(reset)
 
     def register(
         self,
@@ -257,6 +381,7 @@ class Container(ContextualContainer):
         scope: Scope | None = None,
         *,
         tags: tuple[str, ...] = (),
+        idempotent: bool = False,
     ) -> "Container":
         """Register a provider for a token.
 
@@ -266,6 +391,9 @@ class Container(ContextualContainer):
             provider: Callable that returns the dependency instance.
             scope: Optional lifecycle override (defaults to token.scope or TRANSIENT).
             tags: Optional tags for discovery/metadata.
+            idempotent: Declare the provider safe to call more than once. Sync
+                singletons are then initialized without a lock; racing threads
+                may each call the provider, but all receive the same instance.
 
         Returns:
             Self, to allow method chaining.
@@ -303,17 +431,29 @@ class Container(ContextualContainer):
                 raise ValueError(f"Token '{obj_token.name}' is already registered")
             self._providers[obj_token] = cast(ProviderLike[object], provider)
             self._registrations[obj_token] = _Registration(
-                provider=cast(Callable[[], Any], provider), cleanup=CleanupMode.NONE
+                provider=cast(Callable[[], Any], provider),
+                cleanup=CleanupMode.NONE,
+                scope=self._token_scopes.get(obj_token, obj_token.scope),
+                is_async=asyncio.iscoroutinefunction(provider),
             )
             self._type_index[obj_token.type_] = obj_token
+            self._resolve_keys.clear()
+            if idempotent:
+                self._idempotent.add(obj_token)
 
         return self
 
     def register_singleton(
-        self, token: Token[U] | type[U], provider: ProviderLike[U]
+        self,
+        token: Token[U] | type[U],
+        provider: ProviderLike[U],
+        *,
+        idempotent: bool = False,
     ) -> "Container":
         """Register a singleton-scoped dependency."""
-        return self.register(token, provider, scope=Scope.SINGLETON)
+        return self.register(
+            token, provider, scope=Scope.SINGLETON, idempotent=idempotent
+        )
 
     def register_request(
         self, token: Token[U] | type[U], provider: ProviderLike[U]
@@ -394,8 +534,10 @@ class Container(ContextualContainer):
                 cleanup=CleanupMode.CONTEXT_ASYNC
                 if is_async
                 else CleanupMode.CONTEXT_SYNC,
+                scope=self._token_scopes.get(obj_token, obj_token.scope),
             )
             self._type_index[obj_token.type_] = obj_token
+            self._resolve_keys.clear()
         return self
 
     def register_context_sync(
@@ -437,6 +579,8 @@ class Container(ContextualContainer):
         ):
             raise ValueError(f"Token '{obj_token.name}' is already registered")
         self._singletons[obj_token] = value
+        self._type_index[obj_token.type_] = obj_token
+        self._resolve_keys.clear()
         return self
 
     def override(self, token: Token[U], value: U) -> None:
@@ -445,24 +589,44 @@ class Container(ContextualContainer):
         Uses a ContextVar-backed mapping so overrides are isolated between
         threads/tasks. Prefer ``use_overrides`` for scoped overrides.
         """
-        parent = self._overrides.get()
-        merged: dict[Token[object], object] = dict(parent) if parent else {}
+        # Collapse the chain into one layer so repeated calls don't grow it
+        layers: list[Mapping[Token[object], object]] = []
+        node = self._overrides.get()
+        while node is not None:
+            layers.append(node.entries)
+            node = node.parent
+        merged: dict[Token[object], object] = {}
+        for entries in reversed(layers):
+            merged.update(entries)
         merged[cast(Token[object], token)] = value
-        self._overrides.set(merged)
+        self._has_overrides = True
+        self._overrides.set(_OverrideNode(merged, None))
 
     def given(self, type_: type[U], provider: ProviderSync[U] | U) -> "Container":
-        """Register a given instance for a type (Scala-style)."""
-        if callable(provider):
+        """Register a given instance for a type (Scala-style).
+
+        Classes, functions and ``functools.partial`` objects are treated as
+        factories; anything else, including callable instances, is the value.
+        """
+        if isinstance(provider, (type, partial)) or inspect.isroutine(provider):
             self._given_providers[type_] = cast(ProviderSync[object], provider)
         else:
             self._given_providers[type_] = lambda p=provider: p
+        self._given_cache.clear()
 
         return self
 
     def resolve_given(self, type_: type[U]) -> U | None:
-        """Resolve a given instance by type."""
-        provider = self._given_providers.get(type_)
-        if provider:
+        """Resolve a given instance by type, falling back to its base classes."""
+        provider = self._given_cache.get(type_, _MISSING)
+        if provider is _MISSING:
+            provider = None
+            for base in type_.__mro__:
+                provider = self._given_providers.get(base)
+                if provider is not None:
+                    break
+            self._given_cache[type_] = provider
+        if provider is not None:
             return cast(ProviderSync[U], provider)()
         return None
 
@@ -496,21 +660,46 @@ class Container(ContextualContainer):
             yield self
         finally:
             self._given_providers = old_givens
+            self._given_cache.clear()
 
     def _obj_token(self, token: Token[U]) -> Token[object]:
         return cast(Token[object], token)
 
     def _get_singleton_lock(self, token: Token[object]) -> threading.Lock:
         """Get or create a singleton lock for the token, with cleanup after use."""
-        with self._lock:
-            if token not in self._singleton_locks:
-                self._singleton_locks[token] = threading.Lock()
-            return self._singleton_locks[token]
+        lock = self._singleton_locks.get(token)
+        if lock is None:
+            # setdefault is atomic, so racing threads agree on one lock
+            lock = self._singleton_locks.setdefault(token, threading.Lock())
+        return lock
 
     def _cleanup_singleton_lock(self, token: Token[object]) -> None:
         """Remove singleton lock after successful initialization to prevent memory leak."""
-        with self._lock:
-            self._singleton_locks.pop(token, None)
+        self._singleton_locks.pop(token, None)
+
+    def _release_singleton_lock(self, token: Token[object]) -> None:
+        """Drop the token's lock once its singleton exists, on every exit path.
+
+        After a failed initialization the lock is kept, so the next attempt
+        serializes on the same lock instead of racing a fresh one.
+        """
+        if token in self._singletons:
+            self._cleanup_singleton_lock(token)
+
+    def _normalize(self, spec: Token[U] | type[U]) -> Token[U]:
+        """Map a token or type to its canonical token, memoized per key.
+
+        Only keys that land on a registered token are remembered, so an
+        unknown key is re-examined once something gets registered for it.
+        """
+        found = self._resolve_keys.get(spec)
+        if found is not None:
+            return cast(Token[U], found)
+        token = self._canonicalize(self._coerce_to_token(spec))
+        obj_token = self._obj_token(token)
+        if obj_token in self._registrations or obj_token in self._singletons:
+            self._resolve_keys[spec] = obj_token
+        return token
 
     def _canonicalize(self, token: Token[U]) -> Token[U]:
         """Return the registered token that matches by name and type (ignore scope).
@@ -529,11 +718,9 @@ class Container(ContextualContainer):
                 return cast(Token[U], t)
         return token
 
-    def _get_provider(self, token: Token[U]) -> ProviderLike[U]:
-        token = self._canonicalize(token)
-        obj_token = self._obj_token(token)
-        provider = self._providers.get(obj_token)
-        if provider is None:
+    def _get_registration(self, token: Token[U]) -> _Registration[object]:
+        reg = self._registrations_get(self._obj_token(token))
+        if reg is None:
             raise ResolutionError(
                 token,
                 [],
@@ -542,30 +729,11 @@ class Container(ContextualContainer):
                     f"Fix: register a provider for this token before resolving."
                 ),
             )
-        return cast(ProviderLike[U], provider)
-
-    def _get_scope(self, token: Token[U]) -> Scope:
-        token = self._canonicalize(token)
-        return self._token_scopes.get(self._obj_token(token), token.scope)
-
-    def _get_singleton_cached(self, token: Token[U]) -> U | None:
-        token = self._canonicalize(token)
-        obj_token = self._obj_token(token)
-        if obj_token in self._singletons:
-            return cast(U, self._singletons[obj_token])
-        return None
+        return reg
 
     def _set_singleton_cached(self, token: Token[U], value: U) -> None:
         self._singletons[self._obj_token(token)] = value
 
-    def _ensure_async_lock(self, token: Token[U]) -> asyncio.Lock:
-        obj_token = self._obj_token(token)
-        lock = self._async_locks.get(obj_token)
-        if lock is None:
-            lock = asyncio.Lock()
-            self._async_locks[obj_token] = lock
-        return lock
-
     def get(self, token: Token[U] | type[U]) -> U:
         """Resolve a dependency synchronously.
 
@@ -578,64 +746,39 @@ class Container(ContextualContainer):
         Raises:
             ResolutionError: If no provider is registered or resolution fails.
         """
-        # Fast path: check for given instances (85% case)
-        instance = self._resolve_fast_path(token)
-        if instance is not None:
-            return instance
-
-        # Normalize token for resolution
-        token = self._prepare_token_for_resolution(token)
-
-        # Standard resolution path
-        self._cache_misses += 1
-        with self._resolution_guard(token):
-            return self._resolve_sync(token)
-
-    def _resolve_fast_path(self, token: Token[U] | type[U]) -> U | None:
-        """Attempt fast resolution for cached or given instances.
-
-        Args:
-            token: The token or type to resolve
+        # Hot path: a built singleton, with no overrides active in this context
+        if isinstance(token, Token) and (
+            not self._has_overrides or self._overrides_get() is None
+        ):
+            cached: object = self._singletons_get(cast(Token[object], token), _MISSING)
+            if cached is not _MISSING:
+                self._cache_hits += 1
+                return cast(U, cached)
 
-        Returns:
-            The resolved instance if found in cache, None otherwise
-        """
-        # Check givens for types
+        # Givens are keyed by type and take precedence over tokens
         if isinstance(token, type):
             given = self.resolve_given(token)
             if given is not None:
                 self._cache_hits += 1
                 return given
 
-        # Normalize and check overrides/context
-        normalized = self._coerce_to_token(token)
-        normalized = self._canonicalize(normalized)
+        # Normalize once; every later step works on the canonical token
+        token = self._normalize(token)
 
-        # Check override
-        override = self._get_override(normalized)
+        override = self._get_override(token)
         if override is not None:
             self._cache_hits += 1
             return override
 
-        # Check context
-        instance = self.resolve_from_context(normalized)
+        instance = self.resolve_from_context(token)
         if instance is not None:
             self._cache_hits += 1
             return instance
 
-        return None
-
-    def _prepare_token_for_resolution(self, token: Token[U] | type[U]) -> Token[U]:
-        """Prepare a token for resolution by normalizing it.
-
-        Args:
-            token: The token or type to prepare
-
-        Returns:
-            A normalized Token instance
-        """
-        token = self._coerce_to_token(token)
-        return self._canonicalize(token)
+        # Standard resolution path
+        self._cache_misses += 1
+        with self._resolution_guard(token):
+            return self._resolve_sync(token)
 
     def _resolve_sync(self, token: Token[U]) -> U:
         """Resolve a dependency synchronously.
@@ -649,22 +792,20 @@ class Container(ContextualContainer):
         Raises:
             ResolutionError: If resolution fails
         """
-        obj_token = cast(Token[object], token)
-        reg = self._registrations.get(obj_token)
-        effective_scope = self._get_scope(token)
+        reg = self._get_registration(token)
 
         # Dispatch based on registration type
-        match (reg, reg.cleanup if reg else None):
-            case (reg, CleanupMode.CONTEXT_ASYNC) if reg:
+        match reg.cleanup:
+            case CleanupMode.CONTEXT_ASYNC:
                 raise ResolutionError(
                     token,
                     [],
                     "Context-managed provider is async; Use aget() for async providers",
                 )
-            case (reg, CleanupMode.CONTEXT_SYNC) if reg:
-                return self._resolve_sync_context(token, reg, effective_scope)
+            case CleanupMode.CONTEXT_SYNC:
+                return self._resolve_sync_context(token, reg, reg.scope)
             case _:
-                return self._resolve_sync_provider(token, effective_scope)
+                return self._resolve_sync_provider(token, reg)
 
     def _resolve_sync_context(
         self, token: Token[U], reg: _Registration[object], scope: Scope
@@ -700,21 +841,27 @@ class Container(ContextualContainer):
             The resolved instance
         """
         obj_token = self._obj_token(token)
-        with self._get_singleton_lock(obj_token):
-            # Check cache inside lock
-            cached = self._get_singleton_cached(token)
-            if cached is not None:
-                return cached
-
-            # Enter context and cache
-            cm = cast(ContextManager[U], reg.provider())
-            value = cm.__enter__()
-            self._set_singleton_cached(token, value)
-
-            # Register cleanup
-            self._register_singleton_context_cleanup(cm, value)
+        # Lock-free read; the per-token lock is only needed on a miss
+        cached = self._singletons_get(obj_token, _MISSING)
+        if cached is not _MISSING:
+            return cast(U, cached)
 
-        self._cleanup_singleton_lock(obj_token)
+        try:
+            with self._get_singleton_lock(obj_token):
+                # Check cache inside lock
+                cached = self._singletons_get(obj_token, _MISSING)
+                if cached is not _MISSING:
+                    return cast(U, cached)
+
+                # Enter context and cache
+                cm = cast(ContextManager[U], reg.provider())
+                value = cm.__enter__()
+                self._set_singleton_cached(token, value)
+
+                # Register cleanup
+                self._register_singleton_context_cleanup(cm, value)
+        finally:
+            self._release_singleton_lock(obj_token)
         return value
 
     def _resolve_scoped_context_sync(
@@ -767,12 +914,12 @@ class Container(ContextualContainer):
         # as they have no defined lifecycle
         return value
 
-    def _resolve_sync_provider(self, token: Token[U], scope: Scope) -> U:
+    def _resolve_sync_provider(self, token: Token[U], reg: _Registration[object]) -> U:
         """Resolve a standard synchronous provider.
 
         Args:
             token: The token to resolve
-            scope: The effective scope
+            reg: The provider's registration
 
         Returns:
             The resolved instance
@@ -780,19 +927,19 @@ class Container(ContextualContainer):
         Raises:
             ResolutionError: If provider is async
         """
-        provider = self._get_provider(token)
+        provider = cast(ProviderLike[U], self._providers_get(self._obj_token(token)))
 
         # Validate sync provider
-        if asyncio.iscoroutinefunction(cast(Callable[..., Any], provider)):
+        if reg.is_async:
             raise ResolutionError(
                 token, [], "Provider is async; Use aget() for async providers"
             )
 
-        match scope:
+        match reg.scope:
             case Scope.SINGLETON:
                 return self._resolve_singleton_sync(token, provider)
             case Scope.REQUEST | Scope.SESSION:
-                return self._resolve_scoped_sync(token, provider, scope)
+                return self._resolve_scoped_sync(token, provider, reg.scope)
             case _:
                 return self._resolve_transient_sync(token, provider)
 
@@ -807,18 +954,30 @@ class Container(ContextualContainer):
             The resolved instance
         """
         obj_token = self._obj_token(token)
-        with self._get_singleton_lock(obj_token):
-            # Double-check pattern
-            cached = self._get_singleton_cached(token)
-            if cached is not None:
-                return cached
+        # Lock-free read; the per-token lock is only needed on a miss
+        cached = self._singletons_get(obj_token, _MISSING)
+        if cached is not _MISSING:
+            return cast(U, cached)
 
-            # Create and cache instance
+        if obj_token in self._idempotent:
+            # Optimistic init: setdefault is atomic, so racing callers agree
             instance = cast(ProviderSync[U], provider)()
             self._validate_and_track(token, instance)
-            self._set_singleton_cached(token, instance)
+            return cast(U, self._singletons.setdefault(obj_token, instance))
 
-        self._cleanup_singleton_lock(obj_token)
+        try:
+            with self._get_singleton_lock(obj_token):
+                # Double-check pattern
+                cached = self._singletons_get(obj_token, _MISSING)
+                if cached is not _MISSING:
+                    return cast(U, cached)
+
+                # Create and cache instance
+                instance = cast(ProviderSync[U], provider)()
+                self._validate_and_track(token, instance)
+                self._set_singleton_cached(token, instance)
+        finally:
+            self._release_singleton_lock(obj_token)
         return instance
 
     def _resolve_scoped_sync(
@@ -875,8 +1034,13 @@ class Container(ContextualContainer):
         Args:
             value: The value to track
         """
-        if isinstance(value, (SupportsClose, SupportsAsyncClose)):
-            self._resources.append(value)
+        # Direct attribute probes; isinstance() against runtime-checkable
+        # protocols is far slower and checks the same members
+        if callable(getattr(value, "close", None)) or callable(
+            getattr(value, "aclose", None)
+        ):
+            self._resources.append(cast(SupportsClose | SupportsAsyncClose, value))
+            self._resources_snapshot = None
 
     async def aget(self, token: Token[U] | type[U]) -> U:
         """Resolve a dependency asynchronously.
@@ -884,14 +1048,35 @@ class Container(ContextualContainer):
         Equivalent to :meth:`get` but awaits async providers and uses
         async locks for singleton initialization.
         """
-        # Fast path: check for cached instances (85% case)
-        instance = self._resolve_fast_path(token)
+        # Hot path: a built singleton, with no overrides active in this context
+        if isinstance(token, Token) and (
+            not self._has_overrides or self._overrides_get() is None
+        ):
+            cached: object = self._singletons_get(cast(Token[object], token), _MISSING)
+            if cached is not _MISSING:
+                self._cache_hits += 1
+                return cast(U, cached)
+
+        # Givens are keyed by type and take precedence over tokens
+        if isinstance(token, type):
+            given = self.resolve_given(token)
+            if given is not None:
+                self._cache_hits += 1
+                return given
+
+        # Normalize once; every later step works on the canonical token
+        token = self._normalize(token)
+
+        override = self._get_override(token)
+        if override is not None:
+            self._cache_hits += 1
+            return override
+
+        instance = self.resolve_from_context(token)
         if instance is not None:
+            self._cache_hits += 1
             return instance
 
-        # Normalize token for resolution
-        token = self._prepare_token_for_resolution(token)
-
         # Async resolution path
         self._cache_misses += 1
         with self._resolution_guard(token):
@@ -906,19 +1091,17 @@ class Container(ContextualContainer):
         Returns:
             The resolved instance
         """
-        obj_token = cast(Token[object], token)
-        reg = self._registrations.get(obj_token)
-        effective_scope = self._get_scope(token)
+        reg = self._get_registration(token)
 
         # Dispatch based on registration type
-        match (reg, reg.cleanup if reg else None):
-            case (reg, CleanupMode.CONTEXT_ASYNC) if reg:
-                return await self._resolve_async_context(token, reg, effective_scope)
-            case (reg, CleanupMode.CONTEXT_SYNC) if reg:
+        match reg.cleanup:
+            case CleanupMode.CONTEXT_ASYNC:
+                return await self._resolve_async_context(token, reg, reg.scope)
+            case CleanupMode.CONTEXT_SYNC:
                 # Sync context managers can be used in async context
-                return self._resolve_sync_context(token, reg, effective_scope)
+                return self._resolve_sync_context(token, reg, reg.scope)
             case _:
-                return await self._resolve_async_provider(token, effective_scope)
+                return await self._resolve_async_provider(token, reg)
 
     async def _resolve_async_context(
         self, token: Token[U], reg: _Registration[object], scope: Scope
@@ -953,22 +1136,18 @@ class Container(ContextualContainer):
         Returns:
             The resolved instance
         """
-        lock = self._ensure_async_lock(token)
-        async with lock:
-            # Check cache inside lock
-            cached = self._get_singleton_cached(token)
-            if cached is not None:
-                return cached
-
-            # Enter async context and cache
+        cached = self._singletons_get(self._obj_token(token), _MISSING)
+        if cached is not _MISSING:
+            return cast(U, cached)
+
+        async def enter() -> U:
             cm = cast(AsyncContextManager[U], reg.provider())
             value = await cm.__aenter__()
             self._set_singleton_cached(token, value)
-
-            # Register async cleanup
             await self._register_singleton_context_cleanup_async(cm, value)
+            return value
 
-        return value
+        return await self._single_flight(token, enter)
 
     async def _resolve_scoped_context_async(
         self, token: Token[U], reg: _Registration[object], scope: Scope
@@ -1019,54 +1198,108 @@ class Container(ContextualContainer):
         # Note: transient context managers are not tracked for cleanup
         return value
 
-    async def _resolve_async_provider(self, token: Token[U], scope: Scope) -> U:
+    async def _resolve_async_provider(
+        self, token: Token[U], reg: _Registration[object]
+    ) -> U:
         """Resolve a standard provider asynchronously.
 
         Args:
             token: The token to resolve
-            scope: The effective scope
+            reg: The provider's registration
 
         Returns:
             The resolved instance
         """
-        provider = self._get_provider(token)
+        provider = cast(ProviderLike[U], self._providers_get(self._obj_token(token)))
 
-        match scope:
+        match reg.scope:
             case Scope.SINGLETON:
-                return await self._resolve_singleton_async(token, provider)
+                return await self._resolve_singleton_async(
+                    token, provider, reg.is_async
+                )
             case Scope.REQUEST | Scope.SESSION:
-                return await self._resolve_scoped_async(token, provider, scope)
+                return await self._resolve_scoped_async(
+                    token, provider, reg.scope, reg.is_async
+                )
             case _:
-                return await self._resolve_transient_async(token, provider)
+                return await self._resolve_transient_async(
+                    token, provider, reg.is_async
+                )
 
     async def _resolve_singleton_async(
-        self, token: Token[U], provider: ProviderLike[U]
+        self, token: Token[U], provider: ProviderLike[U], is_async: bool
     ) -> U:
         """Resolve a singleton provider asynchronously.
 
         Args:
             token: The token to resolve
             provider: The provider function
+            is_async: Whether the provider is a coroutine function
 
         Returns:
             The resolved instance
         """
-        lock = self._ensure_async_lock(token)
-        async with lock:
-            # Double-check pattern
-            cached = self._get_singleton_cached(token)
-            if cached is not None:
-                return cached
-
-            # Create instance (async or sync)
-            instance = await self._call_provider_async(provider)
+        cached = self._singletons_get(self._obj_token(token), _MISSING)
+        if cached is not _MISSING:
+            return cast(U, cached)
+
+        async def create() -> U:
+            instance = await self._call_provider_async(provider, is_async)
             self._validate_and_track(token, instance)
             self._set_singleton_cached(token, instance)
+            return instance
+
+        return await self._single_flight(token, create)
+
+    async def _single_flight(
+        self, token: Token[U], create: Callable[[], Awaitable[U]]
+    ) -> U:
+        """Run ``create`` once for a singleton token across concurrent tasks.
+
+        Args:
+            token: The singleton token being initialized
+            create: Coroutine factory that builds and caches the instance
+
+        Returns:
+            The instance created by whichever task claimed the token first
+        """
+        obj_token = self._obj_token(token)
+        cached = self._singletons_get(obj_token, _MISSING)
+        if cached is not _MISSING:
+            return cast(U, cached)
+
+        # setdefault claims the slot in one step, so only the first caller
+        # initializes and the rest await its future
+        future: asyncio.Future[object] = asyncio.get_running_loop().create_future()
+        pending = self._inflight.setdefault(obj_token, future)
+        if pending is not future:
+            try:
+                return cast(U, await asyncio.shield(pending))
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+                # The initializing task was cancelled; retry initialization
+                return await self._single_flight(token, create)
+
+        try:
+            instance = await create()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Waiters re-raise it; don't log "exception never retrieved"
+            future.exception()
+            raise
+        else:
+            future.set_result(instance)
+        finally:
+            self._inflight.pop(obj_token, None)
 
         return instance
 
     async def _resolve_scoped_async(
-        self, token: Token[U], provider: ProviderLike[U], scope: Scope
+        self, token: Token[U], provider: ProviderLike[U], scope: Scope, is_async: bool
     ) -> U:
         """Resolve a scoped provider asynchronously.
 
@@ -1074,41 +1307,46 @@ class Container(ContextualContainer):
             token: The token to resolve
             provider: The provider function
             scope: The scope (REQUEST or SESSION)
+            is_async: Whether the provider is a coroutine function
 
         Returns:
             The resolved instance
         """
-        instance = await self._call_provider_async(provider)
+        instance = await self._call_provider_async(provider, is_async)
         self._validate_and_track(token, instance)
         self.store_in_context(token, instance)
         return instance
 
     async def _resolve_transient_async(
-        self, token: Token[U], provider: ProviderLike[U]
+        self, token: Token[U], provider: ProviderLike[U], is_async: bool
     ) -> U:
         """Resolve a transient provider asynchronously.
 
         Args:
             token: The token to resolve
             provider: The provider function
+            is_async: Whether the provider is a coroutine function
 
         Returns:
             The resolved instance
         """
-        instance = await self._call_provider_async(provider)
+        instance = await self._call_provider_async(provider, is_async)
         self._validate_and_track(token, instance)
         return instance
 
-    async def _call_provider_async(self, provider: ProviderLike[U]) -> U:
+    async def _call_provider_async(
+        self, provider: ProviderLike[U], is_async: bool
+    ) -> U:
         """Call a provider function, handling both sync and async providers.
 
         Args:
             provider: The provider function
+            is_async: Whether the provider is a coroutine function
 
         Returns:
             The resolved instance
         """
-        if asyncio.iscoroutinefunction(cast(Callable[..., Any], provider)):
+        if is_async:
             return await cast(ProviderAsync[U], provider)()
         return cast(ProviderSync[U], provider)()
 
@@ -1132,32 +1370,48 @@ class Container(ContextualContainer):
         self, registrations: list[tuple[Token[object], ProviderLike[object]]]
     ) -> Container:
         """Register multiple dependencies at once."""
-        for token, provider in registrations:
-            self.register(token, provider)
+        # Hold the lock across the batch; register() re-enters it cheaply
+        with self._lock:
+            for token, provider in registrations:
+                self.register(token, provider)
         return self
 
     def batch_resolve(self, tokens: list[Token[object]]) -> dict[Token[object], object]:
         """Resolve multiple dependencies efficiently (sync)."""
-        sorted_tokens = sorted(tokens, key=lambda t: t.scope.value)
         results: dict[Token[object], object] = {}
-        for _scope, group in groupby(sorted_tokens, key=lambda t: t.scope):
-            group_list = list(group)
-            for tk in group_list:
+        for tk in tokens:
+            # Resolve each distinct token once, however often it is requested
+            if tk not in results:
                 results[tk] = self.get(tk)
         return results
 
     async def batch_resolve_async(
         self, tokens: list[Token[object]]
     ) -> dict[Token[object], object]:
-        """Async batch resolution with parallel execution."""
-        tasks = {token: self.aget(token) for token in tokens}
-        results_list: list[object] = await asyncio.gather(*tasks.values())
-        return dict(zip(tasks.keys(), results_list, strict=True))
+        """Async batch resolution with parallel execution.
 
-    @lru_cache(maxsize=512)
-    def _get_resolution_path(self, token: Token[Any]) -> tuple[Token[Any], ...]:
-        """Get resolution path for a token (cached)."""
-        return (token,)
+        Tokens backed by plain sync providers are resolved inline; only the
+        rest are gathered, so sync work never round-trips through the loop.
+        """
+        unique = list(dict.fromkeys(tokens))
+        inline: list[Token[object]] = []
+        deferred: list[Token[object]] = []
+        for token in unique:
+            reg = self._registrations_get(token)
+            if reg is not None and not reg.is_async and reg.cleanup is CleanupMode.NONE:
+                inline.append(token)
+            else:
+                deferred.append(token)
+
+        results: dict[Token[object], object] = {
+            token: self.get(token) for token in inline
+        }
+        # Coroutines are created only after inline work can no longer raise
+        gathered: list[object] = await asyncio.gather(
+            *(self.aget(token) for token in deferred)
+        )
+        results.update(zip(deferred, gathered, strict=True))
+        return {token: results[token] for token in unique}
 
     @property
     def cache_hit_rate(self) -> float:
@@ -1171,22 +1425,23 @@ class Container(ContextualContainer):
             "cache_hits": self._cache_hits,
             "cache_misses": self._cache_misses,
             "cache_hit_rate": self.cache_hit_rate,
-            "avg_resolution_time": (
-                sum(self._resolution_times) / len(self._resolution_times)
-                if self._resolution_times
-                else 0
-            ),
+            # Resolution timing is not sampled on the hot path; the key is
+            # kept so existing consumers of this dict keep working
+            "avg_resolution_time": 0.0,
         }
 
     def get_providers_view(
         self,
     ) -> MappingProxyType[Token[object], ProviderLike[object]]:
         """Return a read-only view of registered providers."""
-        return MappingProxyType(self._providers)
+        return self._providers_view
 
     def resources_view(self) -> tuple[SupportsClose | SupportsAsyncClose, ...]:
         """Return a read-only snapshot of tracked resources for tests/inspection."""
-        return tuple(self._resources)
+        snapshot = self._resources_snapshot
+        if snapshot is None:
+            snapshot = self._resources_snapshot = tuple(self._resources)
+        return snapshot
 
     def inject(
         self, func: Callable[..., Any] | None = None, *, cache: bool = True
@@ -1196,8 +1451,6 @@ class Container(ContextualContainer):
         Enables ``@container.inject`` usage in addition to
         ``@inject(container=container)``.
         """
-        from .injection import inject as _inject
-
         if func is None:
             return _inject(container=self, cache=cache)
         return _inject(func, container=self, cache=cache)
@@ -1205,9 +1458,8 @@ class Container(ContextualContainer):
     def has(self, token: Token[Any] | type[Any]) -> bool:
         """Return True if the token/type is known to the container."""
         if isinstance(token, type):
-            if token in self._given_providers:
-                return True
-            token = Token(token.__name__, token)
+            # Every registration path indexes its type; no Token is needed
+            return token in self._given_providers or token in self._type_index
         obj_token = cast(Token[object], token)
         return obj_token in self._providers or obj_token in self._singletons
 
@@ -1215,10 +1467,15 @@ class Container(ContextualContainer):
         """Clear caches and statistics; keep provider registrations intact."""
         with self._lock:
             self._singletons.clear()
+            # Values are gone; only registrations may still back a type
+            self._type_index.clear()
+            for obj_token in self._registrations:
+                self._type_index[obj_token.type_] = obj_token
+            self._resolve_keys.clear()
             self._given_providers.clear()
+            self._given_cache.clear()
             self._cache_hits = 0
             self._cache_misses = 0
-            self._resolution_times.clear()
         self.clear_all_contexts()
 
     def __repr__(self) -> str:
@@ -1276,8 +1533,7 @@ class Container(ContextualContainer):
         """Alias for aclose to align with tests and docs."""
         await self.aclose()
 
-    @contextmanager
-    def use_overrides(self, mapping: dict[Token[Any], object]) -> Iterator[None]:
+    def use_overrides(self, mapping: dict[Token[Any], object]) -> _OverrideScope:
         """Temporarily override tokens for this concurrent context.
 
         Example:
@@ -1285,16 +1541,7 @@ class Container(ContextualContainer):
                 svc = container.get(SERVICE)
                 ...
         """
-        parent = self._overrides.get()
-        merged: dict[Token[object], object] = dict(parent) if parent else {}
-        merged.update(cast(dict[Token[object], object], mapping))
-        token: CtxToken[dict[Token[object], object] | None] = self._overrides.set(
-            merged
-        )
-        try:
-            yield
-        finally:
-            self._overrides.reset(token)
+        return _OverrideScope(self, cast(dict[Token[object], object], mapping))
 
     def clear_overrides(self) -> None:
         """Clear all overrides for the current context."""
@@ -1302,7 +1549,12 @@ class Container(ContextualContainer):
             self._overrides.set(None)
 
     def _validate_and_track(self, token: Token[Any], instance: object) -> None:
+        # A concrete type that passed once passes again; skip the re-check
+        instance_type = type(instance)
+        if self._validated_types.get(token) is instance_type:
+            return
         if not token.validate(instance):
             raise TypeError(
                 f"Provider for token '{token.name}' returned {type(instance).__name__}, expected {token.type_.__name__}"
             )
+        self._validated_types[token] = instance_type
@@ -9,8 +9,9 @@ from collections.abc import AsyncIterator, Iterator
 from contextlib import asynccontextmanager, contextmanager
 from contextvars import ContextVar
 from contextvars import Token as ContextToken
+from functools import partial
 from types import TracebackType
-from typing import Any, Awaitable, Callable, TypeVar, cast
+from typing import Any, Awaitable, Callable, Final, TypeVar, cast
 
 from .exceptions import AsyncCleanupRequiredError
 from .protocols.resources import SupportsAsyncClose, SupportsClose
@@ -26,6 +27,9 @@ __all__ = [
 
 T = TypeVar("T")
 
+# Cache-miss sentinel so a stored ``None`` still shadows outer scopes
+_MISSING: Final = object()
+
 _context_stack: ContextVar[ChainMap[Token[object], object] | None] = ContextVar(
     "pyinj_context_stack", default=None
 )
@@ -69,6 +73,33 @@ def set_context(
     return _context_stack.set(context)
 
 
+def _sync_cleanup(resource: object) -> Callable[[], object] | None:
+    """Pick the sync cleanup hook for ``resource`` (one lookup per hook).
+
+    ``__exit__`` wins over ``close``. Resources that can only be released
+    asynchronously raise :class:`AsyncCleanupRequiredError`.
+    """
+    exit_fn = getattr(resource, "__exit__", None)
+    close = getattr(resource, "close", None)
+    if close is not None and inspect.iscoroutinefunction(close):
+        raise AsyncCleanupRequiredError(
+            type(resource).__name__, "Use an async request/session scope."
+        )
+    if exit_fn is not None:
+        return partial(exit_fn, None, None, None)
+    if close is not None:
+        return close
+    aclose = getattr(resource, "aclose", None)
+    aexit = getattr(resource, "__aexit__", None)
+    if (aclose is not None and inspect.iscoroutinefunction(aclose)) or (
+        aexit is not None and inspect.iscoroutinefunction(aexit)
+    ):
+        raise AsyncCleanupRequiredError(
+            type(resource).__name__, "Use an async request/session scope."
+        )
+    return None
+
+
 class ContextualContainer:
     """Base container adding request/session context via ``contextvars``.
 
@@ -76,11 +107,18 @@ class ContextualContainer:
     are enforced by the :class:`ScopeManager`.
     """
 
+    __slots__ = (
+        "_singletons",
+        "_providers",
+        "_resources",
+        "_scope_manager",
+        "__weakref__",
+    )
+
     def __init__(self) -> None:
         """Initialize contextual container."""
         self._singletons: dict[Token[object], object] = {}
         self._providers: dict[Token[object], Any] = {}
-        self._async_locks: dict[Token[object], asyncio.Lock] = {}
         self._resources: list[SupportsClose | SupportsAsyncClose] = []
         self._scope_manager = ScopeManager(self)
 
@@ -200,48 +238,12 @@ class ContextualContainer:
         # be more smart and intelligent
         # why would there be instances where the resources wouldn't have a aclose or aexit method ?
         # I don't udnrestand this ?
-        resources: list[object] = list(cache.values())
-        for resource in reversed(resources):
+        # Dict views are reversible; no need to copy the cache first
+        for resource in reversed(cache.values()):
             try:
-                # extract this check into a simple function which checks
-                # what exit function has to be used
-                aclose = getattr(resource, "aclose", None)
-                aexit = getattr(resource, "__aexit__", None)
-                supports_sync = hasattr(resource, "close") or hasattr(
-                    resource, "__exit__"
-                )
-
-                # How can we detect this early and use a if guard statement outside of the try/except block
-                # Then raise the exception straight away
-                if (
-                    (aclose and inspect.iscoroutinefunction(aclose))
-                    or (aexit and inspect.iscoroutinefunction(aexit))
-                ) and not supports_sync:
-                    raise AsyncCleanupRequiredError(
-                        type(resource).__name__,
-                        "Use an async request/session scope.",
-                    )
-
-                # why don't you check this get attr and the top itself ?
-                # if these tokens are implmenting the protocols correctly ?
-                # THen do you have to check and perform these hasattr or get attr
-                # The reason for using static type chekcing and the type annotated protocols
-                # is to effectively deal with these cases ?
-                # We need to ensure that contracts are explicitly fulfilled
-                # Instead of writing code which tries to check whether a contract has been fuliffffled
-                # Using hasattr and getattr
-
-                close = getattr(resource, "close", None)
-                if close is not None and inspect.iscoroutinefunction(close):
-                    raise AsyncCleanupRequiredError(
-                        type(resource).__name__,
-                        "Use an async request/session scope.",
-                    )
-                if hasattr(resource, "__exit__"):
-                    exit_fn = getattr(resource, "__exit__")
-                    exit_fn(None, None, None)
-                elif close is not None:
-                    close()
+                cleanup = _sync_cleanup(resource)
+                if cleanup is not None:
+                    cleanup()
             except AsyncCleanupRequiredError:
                 raise
             except Exception:
@@ -257,8 +259,8 @@ class ContextualContainer:
         tasks: list[Awaitable[Any]] = []
         loop = asyncio.get_running_loop()
 
-        resources: list[object] = list(cache.values())
-        for resource in reversed(resources):
+        # Dict views are reversible; no need to copy the cache first
+        for resource in reversed(cache.values()):
             aclose = getattr(resource, "aclose", None)
             if aclose and callable(aclose):
                 res = aclose()
@@ -322,8 +324,17 @@ class ScopeManager:
     Precedence: REQUEST > SESSION > SINGLETON. Uses ContextVars for async safety.
     """
 
+    __slots__ = ("_container", "_store_handlers")
+
     def __init__(self, container: ContextualContainer) -> None:
         self._container = container
+        # Writers indexed by ``scope - 1``, bound once so storing is one index
+        self._store_handlers: tuple[Callable[[Token[object], object], None], ...] = (
+            self._store_singleton,  # Scope.SINGLETON
+            container._put_in_current_request_cache,  # Scope.REQUEST
+            self._store_session,  # Scope.SESSION
+            self._store_transient,  # Scope.TRANSIENT
+        )
 
     @contextmanager
     def request_scope(self) -> Iterator[None]:
@@ -423,33 +434,42 @@ class ScopeManager:
                 _session_context.reset(session_token)
 
     def resolve_from_context(self, token: Token[T]) -> T | None:
+        key = cast(Token[object], token)
         context = _context_stack.get()
         if context is not None:
-            key = cast(Token[object], token)
-            if key in context:
-                return cast(T, context[key])
-        if token.scope == Scope.SESSION:
+            # Single pass over the chained caches (one probe per map)
+            for cache in context.maps:
+                value = cache.get(key, _MISSING)
+                if value is not _MISSING:
+                    return cast(T, value)
+        # Fall back to the scope's own store; read the scope once and
+        # compare by identity (enum members are singletons)
+        scope = token.scope
+        if scope is Scope.SINGLETON:
+            return cast(T | None, self._container._singletons.get(key))
+        if scope is Scope.SESSION:
             session = _session_context.get()
-            if session and token in session:
-                return cast(T, session[cast(Token[object], token)])
-        if token.scope == Scope.SINGLETON and token in self._container._singletons:
-            return cast(T, self._container._singletons[cast(Token[object], token)])
+            if session:
+                return cast(T | None, session.get(key))
         # Transients are never cached - always return None to force new instance
         return None
 
     def store_in_context(self, token: Token[T], instance: T) -> None:
-        if token.scope == Scope.SINGLETON:
-            self._container._singletons[cast(Token[object], token)] = cast(
-                object, instance
-            )
-        elif token.scope == Scope.REQUEST:
-            self._container._put_in_current_request_cache(token, instance)
-        elif token.scope == Scope.SESSION:
-            session = _session_context.get()
-            if session is not None:
-                session[cast(Token[object], token)] = cast(object, instance)
-        elif token.scope == Scope.TRANSIENT:
-            pass
+        self._store_handlers[token.scope - 1](
+            cast(Token[object], token), cast(object, instance)
+        )
+
+    def _store_singleton(self, token: Token[object], instance: object) -> None:
+        self._container._singletons[token] = instance
+
+    def _store_session(self, token: Token[object], instance: object) -> None:
+        session = _session_context.get()
+        if session is not None:
+            session[token] = instance
+
+    def _store_transient(self, token: Token[object], instance: object) -> None:
+        # Transients are never cached
+        pass
 
     def clear_request_context(self) -> None:
         context = _context_stack.get()
@@ -476,6 +496,8 @@ class RequestScope:
             service = scope.resolve(ServiceToken)
     """
 
+    __slots__ = ("container", "_context_manager", "_async_context_manager")
+
     def __init__(self, container: ContextualContainer):
         """Initialize request scope."""
         self.container = container
@@ -528,6 +550,8 @@ class SessionScope:
             user = scope.resolve(UserToken)
     """
 
+    __slots__ = ("container", "_context_manager")
+
     def __init__(self, container: ContextualContainer):
         """Initialize session scope."""
         self.container = container
@@ -40,7 +40,12 @@ class DefaultContainer:
 
 def get_default_container() -> "Resolvable[Any]":
     """Function alias for DefaultContainer.get()."""
-    return DefaultContainer.get()
+    # Read the module global directly once initialized; only the first call
+    # needs to go through the lazy-creation path
+    container = _default_container
+    if container is None:
+        return DefaultContainer.get()
+    return container
 
 
 def set_default_container(container: "Resolvable[Any]") -> None:
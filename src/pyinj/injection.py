@@ -18,6 +18,7 @@ from typing import (
     Awaitable,
     Callable,
     ClassVar,
+    Coroutine,
     Generic,
     ParamSpec,
     TypeAlias,
@@ -148,12 +149,17 @@ class _DepKind(Enum):
     INJECT = auto()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _DepSpec:
     kind: _DepKind
     type_: type[Any] | None = None
     token: Token[object] | None = None
     provider: Callable[[], Any] | None = None
+    provider_is_async: bool = False
+
+
+# Dependency plan compiled at decoration time: (parameter name, spec) pairs
+_Plan: TypeAlias = tuple[tuple[str, _DepSpec], ...]
 
 
 @lru_cache(maxsize=256)
@@ -328,22 +334,58 @@ def resolve_dependencies(
     Returns:
         Dictionary of resolved dependencies
     """
+    return _resolve_plan(_compile_plan(deps), container, overrides)
+
+
+def _resolve_plan(
+    plan: _Plan,
+    container: Resolvable[object],
+    overrides: dict[str, object] | None = None,
+) -> dict[str, object]:
     resolved: dict[str, object] = {}
     ov = overrides or {}
-    for name, req in deps.items():
+    for name, spec in plan:
         if name in ov:
             resolved[name] = ov[name]
             continue
-        spec = _to_spec(req)
         resolved[name] = _resolve_one(spec, container)
     return resolved
 
 
+def _compile_plan(deps: dict[str, DependencyRequest]) -> _Plan:
+    """Convert analyzed dependencies into resolution specs once, up front."""
+    return tuple((name, _to_spec(req)) for name, req in deps.items())
+
+
+def _compile_call(fn: Callable[..., Any]) -> tuple[_Plan, tuple[str, ...]]:
+    """Compile the dependency plan and positional layout for a wrapped callable.
+
+    Returns the plan together with the names of the non-injected parameters
+    that positional arguments bind to, so wrappers never inspect the
+    signature per call.
+    """
+    plan = _compile_plan(InjectionAnalyzer.build_plan(fn))
+    injected = {name for name, _spec in plan}
+    positional = tuple(
+        name
+        for name, param in signature(fn).parameters.items()
+        if name not in injected
+        and param.kind in (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD)
+    )
+    return plan, positional
+
+
 def _to_spec(spec: DependencyRequest) -> _DepSpec:
     if isinstance(spec, Token):
         return _DepSpec(kind=_DepKind.TOKEN, token=spec)
     if isinstance(spec, Inject):
-        return _DepSpec(kind=_DepKind.INJECT, type_=spec.type, provider=spec.provider)
+        provider = spec.provider
+        return _DepSpec(
+            kind=_DepKind.INJECT,
+            type_=spec.type,
+            provider=provider,
+            provider_is_async=provider is not None and iscoroutinefunction(provider),
+        )
     # else it's a type
     return _DepSpec(kind=_DepKind.TYPE, type_=cast(type[Any], spec))
 
@@ -413,16 +455,40 @@ async def resolve_dependencies_async(
     Returns:
         Dictionary of resolved dependencies
     """
+    return await _aresolve_plan(_compile_plan(deps), container, overrides)
+
+
+async def _aresolve_plan(
+    plan: _Plan,
+    container: Resolvable[object],
+    overrides: dict[str, object] | None = None,
+) -> dict[str, object]:
     resolved: dict[str, object] = {}
     overrides = overrides or {}
     tasks: dict[str, asyncio.Task[object]] = {}
 
-    for name, req in deps.items():
-        if name in overrides:
-            resolved[name] = overrides[name]
-            continue
-        spec = _to_spec(req)
-        tasks[name] = asyncio.create_task(_aresolve_one(spec, container))
+    try:
+        for name, spec in plan:
+            if name in overrides:
+                resolved[name] = overrides[name]
+                continue
+            if spec.provider is not None and not spec.provider_is_async:
+                # Plain sync providers run inline instead of via a scheduled task
+                result = spec.provider()
+                if asyncio.iscoroutine(result):
+                    tasks[name] = asyncio.create_task(
+                        cast(Coroutine[Any, Any, object], result)
+                    )
+                else:
+                    resolved[name] = result
+                continue
+            tasks[name] = asyncio.create_task(_aresolve_one(spec, container))
+    except BaseException:
+        # An inline provider failed: don't orphan tasks already started
+        for task in tasks.values():
+            task.cancel()
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
+        raise
 
     # Resolve all tasks in parallel
     if tasks:
@@ -491,8 +557,11 @@ def inject(
     """
 
     def decorator(fn: Callable[P, R]) -> Callable[P, R]:
-        # Analyze dependencies (cached if cache=True)
-        deps = InjectionAnalyzer.build_plan(fn) if cache else None
+        # Analyze dependencies and argument layout (up front if cache=True)
+        compiled = _compile_call(fn) if cache else None
+        if compiled is not None and not compiled[0]:
+            # Nothing to inject: skip the wrapper and its per-call frame
+            return fn
 
         if iscoroutinefunction(fn):
             # Are there are any issues of this being an async wrapper inside a decorator?
@@ -504,42 +573,31 @@ def inject(
             @wraps(fn)
             async def async_wrapper(*args: Any, **kwargs: Any) -> R:
                 # Get dependencies if not cached
-                nonlocal deps
-                if deps is None:
-                    deps = InjectionAnalyzer.build_plan(fn)
+                nonlocal compiled
+                if compiled is None:
+                    compiled = _compile_call(fn)
+                plan, positional = compiled
 
-                if not deps:
+                if not plan:
                     # No dependencies, call original
                     return await fn(*args, **kwargs)
 
-                # Get container
-                nonlocal container
-                if container is None:
-                    container = get_default_container()
+                # Explicit container, else whatever is currently the default
+                resolver = (
+                    container if container is not None else get_default_container()
+                )
 
                 # Extract overrides from kwargs
                 overrides: dict[str, Any] = {}
-                for name in deps:
+                for name, _spec in plan:
                     if name in kwargs:  # type: ignore[operator]
                         overrides[name] = cast(Any, kwargs.pop(name))  # type: ignore[call-arg]
 
                 # Resolve dependencies
-                resolved = await resolve_dependencies_async(deps, container, overrides)
-
-                # Rebind arguments: skip injected params from positional binding
-                sig = signature(fn)
-                new_kwargs: dict[str, Any] = {}
-                arg_i = 0
-                for pname, param in sig.parameters.items():
-                    if pname in resolved:
-                        # will be injected
-                        continue
-                    if param.kind in (
-                        Parameter.POSITIONAL_ONLY,
-                        Parameter.POSITIONAL_OR_KEYWORD,
-                    ) and arg_i < len(args):
-                        new_kwargs[pname] = args[arg_i]
-                        arg_i += 1
+                resolved = await _aresolve_plan(plan, resolver, overrides)
+
+                # Rebind positional arguments to the non-injected parameters
+                new_kwargs: dict[str, Any] = dict(zip(positional, args))
                 # bring through any explicit kwargs provided
                 new_kwargs.update(kwargs)
                 # inject resolved deps
@@ -554,41 +612,31 @@ def inject(
             @wraps(fn)
             def sync_wrapper(*args: Any, **kwargs: Any) -> R:
                 # Get dependencies if not cached
-                nonlocal deps
-                if deps is None:
-                    deps = InjectionAnalyzer.build_plan(fn)
+                nonlocal compiled
+                if compiled is None:
+                    compiled = _compile_call(fn)
+                plan, positional = compiled
 
-                if not deps:
+                if not plan:
                     # No dependencies, call original
                     return fn(*args, **kwargs)
 
-                # Get container
-                nonlocal container
-                if container is None:
-                    container = get_default_container()
+                # Explicit container, else whatever is currently the default
+                resolver = (
+                    container if container is not None else get_default_container()
+                )
 
                 # Extract overrides from kwargs
                 overrides: dict[str, Any] = {}
-                for name in deps:
+                for name, _spec in plan:
                     if name in kwargs:  # type: ignore[operator]
                         overrides[name] = cast(Any, kwargs.pop(name))  # type: ignore[call-arg]
 
                 # Resolve dependencies
-                resolved = resolve_dependencies(deps, container, overrides)
-
-                # Rebind arguments: skip injected params from positional binding
-                sig = signature(fn)
-                new_kwargs: dict[str, Any] = {}
-                arg_i = 0
-                for pname, param in sig.parameters.items():
-                    if pname in resolved:
-                        continue
-                    if param.kind in (
-                        Parameter.POSITIONAL_ONLY,
-                        Parameter.POSITIONAL_OR_KEYWORD,
-                    ) and arg_i < len(args):
-                        new_kwargs[pname] = args[arg_i]
-                        arg_i += 1
+                resolved = _resolve_plan(plan, resolver, overrides)
+
+                # Rebind positional arguments to the non-injected parameters
+                new_kwargs: dict[str, Any] = dict(zip(positional, args))
                 new_kwargs.update(kwargs)
                 new_kwargs.update(resolved)
 
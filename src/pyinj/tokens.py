@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from enum import Enum, auto
+from enum import IntEnum
 from types import MappingProxyType
 from typing import Any, Generic, TypeVar, cast
 
@@ -12,7 +12,7 @@ __all__ = ["Scope", "Token", "TokenFactory"]
 T = TypeVar("T")
 
 
-class Scope(Enum):
+class Scope(IntEnum):
     """Lifecycle scope for dependencies.
 
     Values:
@@ -20,12 +20,15 @@ class Scope(Enum):
         REQUEST: One instance per request context.
         SESSION: One instance per longer-lived session context.
         TRANSIENT: A new instance for every resolution.
+
+    Values are dense from one (members stay truthy), so ``scope - 1``
+    indexes a per-scope table.
     """
 
-    SINGLETON = auto()  # Process-wide singleton
-    REQUEST = auto()  # Request/context scoped
-    SESSION = auto()  # Session scoped
-    TRANSIENT = auto()  # New instance every time
+    SINGLETON = 1  # Process-wide singleton
+    REQUEST = 2  # Request/context scoped
+    SESSION = 3  # Session scoped
+    TRANSIENT = 4  # New instance every time
 
 
 @dataclass(frozen=True, slots=True)
@@ -69,6 +72,9 @@ class Token(Generic[T]):
         return self._hash
 
     def __eq__(self, other: object) -> bool:
+        # Module-level tokens are reused everywhere; identity is the common case
+        if self is other:
+            return True
         if not isinstance(other, Token):
             return False
         other_token = cast("Token[object]", other)
@@ -158,6 +164,8 @@ class Token(Generic[T]):
 class TokenFactory:
     """Factory for creating and caching commonly used tokens."""
 
+    __slots__ = ("_cache",)
+
     def __init__(self) -> None:
         self._cache: dict[tuple[str, type[Any], Scope, str | None], Token[Any]] = {}
 
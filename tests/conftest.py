@@ -1,13 +1,47 @@
 """Pytest configuration and shared fixtures for pyinj tests."""
 
+from __future__ import annotations
+
 import asyncio
-from typing import AsyncGenerator, Generator
+from types import MappingProxyType
+from typing import AsyncGenerator, Mapping
 
 import pytest
 
 from pyinj.container import Container
 from pyinj.tokens import Token
 
+try:
+    import uvloop
+except ImportError:  # Windows, or dev extras not installed
+    uvloop = None
+
+
+if uvloop is not None:
+
+    @pytest.fixture(scope="session")
+    def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+        """Run async tests on uvloop's libuv-backed event loop."""
+        return uvloop.EventLoopPolicy()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--runslow", action="store_true", default=False, help="run slow tests"
+    )
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    """Skip ``slow``-marked tests unless ``--runslow`` is given."""
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="needs --runslow")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
 
 @pytest.fixture
 def container() -> Container:
@@ -21,9 +55,9 @@ def registered_container() -> Container:
     container = Container()
 
     # Register some test dependencies
-    container.register(Token("database", TestDatabase), lambda: TestDatabase())
-    container.register(Token("cache", TestCache), lambda: TestCache())
-    container.register_singleton(Token("config", TestConfig), lambda: TestConfig())
+    container.register(DATABASE, TestDatabase)
+    container.register(CACHE, TestCache)
+    container.register_singleton(CONFIG, TestConfig)
 
     return container
 
@@ -41,6 +75,8 @@ async def async_container() -> AsyncGenerator[Container, None]:
 class TestDatabase:
     """Test database for fixtures."""
 
+    __slots__ = ("connected",)
+
     def __init__(self):
         self.connected = True
 
@@ -51,39 +87,37 @@ class TestDatabase:
 class TestCache:
     """Test cache for fixtures."""
 
+    __slots__ = ("data",)
+
     def __init__(self) -> None:
-        self.data: dict[str, str] = {}
+        # Allocated on first write; most fixtures never touch the cache
+        self.data: dict[str, str] | None = None
 
     def get(self, key: str) -> str | None:
-        return self.data.get(key)
+        return None if self.data is None else self.data.get(key)
 
     def set(self, key: str, value: str) -> None:
+        if self.data is None:
+            self.data = {}
         self.data[key] = value
 
 
 class TestConfig:
     """Test configuration for fixtures."""
 
-    def __init__(self) -> None:
-        self.settings = {
+    __slots__ = ()
+
+    # Constant and read-only, so every instance shares the one mapping
+    settings: Mapping[str, object] = MappingProxyType(
+        {
             "debug": True,
             "host": "localhost",
             "port": 8080,
         }
+    )
 
 
-# Pytest configuration
-def pytest_configure(config: pytest.Config) -> None:
-    """Configure pytest with custom markers."""
-    config.addinivalue_line("markers", "unit: mark test as unit test")
-    config.addinivalue_line("markers", "integration: mark test as integration test")
-    config.addinivalue_line("markers", "slow: mark test as slow running")
-
-
-# Async event loop fixture for pytest-asyncio
-@pytest.fixture
-def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
-    """Create an event loop for async tests."""
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
+# Tokens are immutable, so fixtures share one instance of each
+DATABASE = Token("database", TestDatabase)
+CACHE = Token("cache", TestCache)
+CONFIG = Token("config", TestConfig)
@@ -9,27 +9,42 @@ from __future__ import annotations
 
 import asyncio
 from contextlib import asynccontextmanager
-from typing import Annotated, Any
+from typing import Annotated, Any, AsyncIterator, Awaitable, Callable, cast
 
 import httpx
 import pytest
 
 from pyinj.container import Container
+from pyinj.exceptions import AsyncCleanupRequiredError
 from pyinj.injection import Inject, inject
 from pyinj.tokens import Scope, Token
 
+pytestmark = pytest.mark.integration
+
+
+async def _path_handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={"path": request.url.path})
+
+
+# MockTransport holds no per-client state, so every client can share it
+_PATH_TRANSPORT = httpx.MockTransport(_path_handler)
+
 
 def _make_mock_httpx() -> httpx.AsyncClient:
-    async def handler(request: httpx.Request) -> httpx.Response:
-        return httpx.Response(200, json={"path": request.url.path})
+    return httpx.AsyncClient(transport=_PATH_TRANSPORT, base_url="https://svc")
 
-    return httpx.AsyncClient(
-        transport=httpx.MockTransport(handler), base_url="https://svc"
-    )
+
+@pytest.fixture(scope="module")
+async def mock_httpx_client() -> AsyncIterator[httpx.AsyncClient]:
+    """One mock client per module; tests borrow it and leave closing to us."""
+    client = _make_mock_httpx()
+    yield client
+    await client.aclose()
 
 
-@pytest.mark.asyncio
-async def test_user_style_project_di_with_httpx_only() -> None:
+async def test_user_style_project_di_with_httpx_only(
+    mock_httpx_client: httpx.AsyncClient,
+) -> None:
     container = Container()
 
     # Tokens a user would define centrally
@@ -38,7 +53,7 @@ async def test_user_style_project_di_with_httpx_only() -> None:
     # Providers users would register during app startup
     async def create_http_client() -> httpx.AsyncClient:
         await asyncio.sleep(0)
-        return _make_mock_httpx()
+        return mock_httpx_client
 
     container.register(httpx_token, create_http_client)
 
@@ -51,21 +66,24 @@ async def test_user_style_project_di_with_httpx_only() -> None:
         r = await client.get(f"/users/{user_id}")
         return {"status": r.status_code, "path": r.json()["path"]}
 
-    # Simulate concurrent requests with isolated scopes
-    from typing import Awaitable, Callable, cast
+    # Injected params are filled in, so callers pass only user_id
+    wrapped = cast(Callable[[int], Awaitable[dict[str, Any]]], endpoint)
 
+    # Simulate concurrent requests with isolated scopes
     async def call(uid: int) -> dict[str, Any]:
         async with container.async_request_scope():
-            wrapped = cast(Callable[[int], Awaitable[dict[str, Any]]], endpoint)
             return await wrapped(uid)
 
-    results = await asyncio.gather(*(call(i) for i in range(10)))
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(call(i)) for i in range(10)]
+    results = [t.result() for t in tasks]
     assert all(r["status"] == 200 for r in results)
     assert all(r["path"].startswith("/users/") for r in results)
 
     # Singleton instances created only once
-    c1 = await container.aget(httpx_token)
-    c2 = await container.aget(httpx_token)
+    c1, c2 = await asyncio.gather(
+        container.aget(httpx_token), container.aget(httpx_token)
+    )
     assert c1 is c2
 
     # No DB in this variant
@@ -73,8 +91,8 @@ async def test_user_style_project_di_with_httpx_only() -> None:
     await container.aclose()
 
 
-@pytest.mark.asyncio
-async def test_playwright_style_fake_browser_with_cleanup() -> None:
+@pytest.mark.parametrize("workers", [8, pytest.param(50, marks=pytest.mark.slow)])
+async def test_playwright_style_fake_browser_with_cleanup(workers: int) -> None:
     container = Container()
 
     class FakeBrowser:
@@ -106,7 +124,9 @@ async def test_playwright_style_fake_browser_with_cleanup() -> None:
         await b.goto(f"https://example/{i}")
         return True
 
-    ok = await asyncio.gather(*(worker(i) for i in range(20)))
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(worker(i)) for i in range(workers)]
+    ok = [t.result() for t in tasks]
     assert all(ok)
 
     b = await container.aget(browser_token)
@@ -114,8 +134,9 @@ async def test_playwright_style_fake_browser_with_cleanup() -> None:
     assert b.closed is True
 
 
-@pytest.mark.asyncio
-async def test_sync_cleanup_circuit_breaker_raises_for_async_resources() -> None:
+async def test_sync_cleanup_circuit_breaker_raises_for_async_resources(
+    mock_httpx_client: httpx.AsyncClient,
+) -> None:
     """Using sync cleanup with async-only resources should fail fast.
 
     This ensures developers get immediate feedback to await async cleanup
@@ -127,11 +148,8 @@ async def test_sync_cleanup_circuit_breaker_raises_for_async_resources() -> None
 
     @asynccontextmanager
     async def client_cm():
-        client = _make_mock_httpx()
-        try:
-            yield client
-        finally:
-            await client.aclose()
+        # The module fixture owns the client, so exiting must not close it
+        yield mock_httpx_client
 
     container.register_context(httpx_token, lambda: client_cm(), is_async=True)
 
@@ -142,8 +160,6 @@ async def test_sync_cleanup_circuit_breaker_raises_for_async_resources() -> None
     assert len(resources) > 0
 
     # Using sync context manager should raise due to async cleanup required
-    from pyinj.exceptions import AsyncCleanupRequiredError
-
     with pytest.raises(AsyncCleanupRequiredError):
         with container:
             pass
@@ -1,10 +1,14 @@
 """Async functionality and race condition tests."""
 
 import asyncio
+from collections.abc import Awaitable
+from contextlib import asynccontextmanager
+from typing import cast
 
 import pytest
 
 from pyinj import Container, ResolutionError, Scope, Token
+from pyinj.exceptions import CircularDependencyError
 
 
 class MockAsyncResource:
@@ -22,7 +26,6 @@ class MockAsyncResource:
 class TestAsyncResolution:
     """Test async dependency resolution."""
 
-    @pytest.mark.asyncio
     async def test_async_provider_resolution(self):
         """Test resolving async providers."""
         container = Container()
@@ -37,7 +40,6 @@ class TestAsyncResolution:
         result = await container.aget(token)
         assert result == "async result"
 
-    @pytest.mark.asyncio
     async def test_sync_provider_in_async_context(self):
         """Test that sync providers work in async resolution."""
         container = Container()
@@ -66,7 +68,6 @@ class TestAsyncResolution:
 
         assert "Use aget() for async providers" in str(exc_info.value)
 
-    @pytest.mark.asyncio
     async def test_async_singleton_creation(self):
         """Test that async singletons are created properly."""
         container = Container()
@@ -91,7 +92,6 @@ class TestAsyncResolution:
         # Should only be created once
         assert creation_count == 1
 
-    @pytest.mark.asyncio
     async def test_async_singleton_race_condition(self):
         """Test that concurrent async singleton creation doesn't cause race conditions."""
         container = Container()
@@ -112,8 +112,6 @@ class TestAsyncResolution:
         container.register(token, create_resource, Scope.SINGLETON)
 
         # Launch many concurrent resolutions
-        from collections.abc import Awaitable
-
         tasks: list[Awaitable[dict[str, object]]] = [
             container.aget(token) for _ in range(50)
         ]
@@ -128,7 +126,6 @@ class TestAsyncResolution:
         assert creation_count == 1
         assert first_result["id"] == 1
 
-    @pytest.mark.asyncio
     async def test_mixed_async_sync_dependencies(self):
         """Test resolving mixed async and sync dependencies."""
         container = Container()
@@ -157,16 +154,106 @@ class TestAsyncResolution:
 
         assert result == {"sync": "sync_value", "async": "async_value"}
 
+    async def test_async_singleton_failure_shared_with_waiters(self):
+        """Test concurrent waiters see the initializer's failure, then retry works."""
+        container = Container()
+        token = Token("flaky", MockAsyncResource)
+        attempts = 0
+
+        async def create_resource() -> MockAsyncResource:
+            nonlocal attempts
+            attempts += 1
+            await asyncio.sleep(0.001)
+            if attempts == 1:
+                raise RuntimeError("boom")
+            return MockAsyncResource()
+
+        container.register(token, create_resource, Scope.SINGLETON)
+
+        results = await asyncio.gather(
+            *(container.aget(token) for _ in range(5)), return_exceptions=True
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert attempts == 1
+
+        resource = await container.aget(token)
+        assert resource is await container.aget(token)
+        assert attempts == 2
+
+    async def test_async_singleton_retries_after_initializer_cancelled(self):
+        """Test a waiter retries initialization when the initializer is cancelled."""
+        container = Container()
+        token = Token("slow", MockAsyncResource)
+        started = asyncio.Event()
+        attempts = 0
+
+        async def create_resource() -> MockAsyncResource:
+            nonlocal attempts
+            attempts += 1
+            if attempts == 1:
+                started.set()
+                await asyncio.sleep(10)
+            return MockAsyncResource()
+
+        container.register(token, create_resource, Scope.SINGLETON)
+
+        first = asyncio.create_task(container.aget(token))
+        await started.wait()
+        waiter = asyncio.create_task(container.aget(token))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        resource = await waiter
+        assert isinstance(resource, MockAsyncResource)
+        assert first.cancelled()
+        assert attempts == 2
+
+    async def test_batch_resolve_async_resolves_duplicates_once(self):
+        """Test repeated tokens in a batch are resolved a single time."""
+        container = Container()
+        token = Token("resource", MockAsyncResource)
+        calls = 0
+
+        async def create_resource() -> MockAsyncResource:
+            nonlocal calls
+            calls += 1
+            return MockAsyncResource()
+
+        container.register(token, create_resource)
+
+        results = await container.batch_resolve_async(
+            cast(list[Token[object]], [token, token, token])
+        )
+
+        assert list(results) == [token]
+        assert calls == 1
+
+    async def test_batch_resolve_async_mixes_sync_and_async_providers(self):
+        """Test mixed batches keep request order and resolve every token."""
+        container = Container()
+        sync_token = Token("sync_resource", MockAsyncResource)
+        async_token = Token("async_resource", MockAsyncResource)
+
+        async def create_resource() -> MockAsyncResource:
+            return MockAsyncResource()
+
+        container.register(sync_token, MockAsyncResource)
+        container.register(async_token, create_resource)
+
+        results = await container.batch_resolve_async(
+            cast(list[Token[object]], [async_token, sync_token])
+        )
+
+        assert list(results) == [async_token, sync_token]
+        assert all(isinstance(v, MockAsyncResource) for v in results.values())
+
 
 class TestAsyncCleanup:
     """Test async resource cleanup."""
 
-    @pytest.mark.asyncio
     async def test_async_resource_tracking(self):
         """Test that async resources are tracked for cleanup."""
         container = Container()
-        from contextlib import asynccontextmanager
-
         token = Token("async_resource", MockAsyncResource)
 
         @asynccontextmanager
@@ -188,7 +275,6 @@ class TestAsyncCleanup:
         await container.dispose()
         assert resource.closed
 
-    @pytest.mark.asyncio
     async def test_dispose_multiple_async_resources(self):
         """Test disposing of multiple async resources."""
         container = Container()
@@ -201,8 +287,6 @@ class TestAsyncCleanup:
             return resource
 
         # Register multiple singleton resources
-        from contextlib import asynccontextmanager
-
         for i in range(3):
             token = Token(f"resource_{i}", MockAsyncResource)
 
@@ -230,7 +314,6 @@ class TestAsyncCleanup:
         for resource in resources_created:
             assert resource.closed
 
-    @pytest.mark.asyncio
     async def test_dispose_with_cleanup_errors(self):
         """Test that dispose handles cleanup errors gracefully."""
 
@@ -243,8 +326,6 @@ class TestAsyncCleanup:
                 raise RuntimeError("Cleanup error!")
 
         container = Container()
-        from contextlib import asynccontextmanager
-
         token = Token("problematic", ProblematicResource)
 
         @asynccontextmanager
@@ -266,7 +347,6 @@ class TestAsyncCleanup:
         # Resource should still be marked as closed
         assert resource.closed
 
-    @pytest.mark.asyncio
     async def test_dispose_clears_state(self):
         """Test that dispose clears container state."""
         container = Container()
@@ -294,7 +374,6 @@ class TestAsyncCleanup:
 class TestAsyncInjection:
     """Test async dependency injection."""
 
-    @pytest.mark.asyncio
     async def test_inject_async_function(self):
         """Test injecting dependencies into async functions."""
         container = Container()
@@ -314,7 +393,6 @@ class TestAsyncInjection:
         result = await async_function()
         assert result == "Result: injected"
 
-    @pytest.mark.asyncio
     async def test_async_circular_dependency_detection(self):
         """Test circular dependency detection in async context."""
         container = Container()
@@ -330,7 +408,5 @@ class TestAsyncInjection:
         container.register(token_a, provider_a)
         container.register(token_b, provider_b)
 
-        from pyinj.exceptions import CircularDependencyError
-
         with pytest.raises(CircularDependencyError):
             await container.aget(token_a)
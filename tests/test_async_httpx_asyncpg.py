@@ -21,30 +21,34 @@ from pyinj.tokens import Scope, Token
 class FakeAsyncPGPool:
     """A lightweight asyncpg-like pool with aclose()."""
 
+    __slots__ = ("closed", "created")
+
     def __init__(self) -> None:
         self.closed = False
         self.created = asyncio.get_running_loop().time()
 
     async def fetch(self, query: str) -> list[dict[str, Any]]:
-        await asyncio.sleep(0.001)
+        await asyncio.sleep(0)
         return [{"query": query, "at": asyncio.get_running_loop().time()}]
 
     async def aclose(self) -> None:
         self.closed = True
 
 
-def make_httpx_client() -> httpx.AsyncClient:
-    async def handler(request: httpx.Request) -> httpx.Response:
-        return httpx.Response(
-            200, json={"method": request.method, "url": str(request.url)}
-        )
+async def _echo_handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={"method": request.method, "url": str(request.url)})
+
 
-    transport = httpx.MockTransport(handler)
-    return httpx.AsyncClient(transport=transport, base_url="https://example.test")
+# MockTransport holds no per-client state, so every client can share it
+_ECHO_TRANSPORT = httpx.MockTransport(_echo_handler)
+
+
+def make_httpx_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=_ECHO_TRANSPORT, base_url="https://example.test")
 
 
-@pytest.mark.asyncio
-async def test_async_singleton_httpx_concurrency() -> None:
+@pytest.mark.parametrize("workers", [8, pytest.param(50, marks=pytest.mark.slow)])
+async def test_async_singleton_httpx_concurrency(workers: int) -> None:
     container = Container()
     client_token = Token("httpx", httpx.AsyncClient, scope=Scope.SINGLETON)
 
@@ -52,7 +56,7 @@ async def test_async_singleton_httpx_concurrency() -> None:
 
     async def create_client() -> httpx.AsyncClient:
         nonlocal created
-        await asyncio.sleep(0.002)
+        await asyncio.sleep(0)
         created += 1
         return make_httpx_client()
 
@@ -62,14 +66,13 @@ async def test_async_singleton_httpx_concurrency() -> None:
         client = await container.aget(client_token)
         return await client.get(f"/w/{i}")
 
-    results = await asyncio.gather(*(worker(i) for i in range(50)))
+    results = await asyncio.gather(*(worker(i) for i in range(workers)))
     assert all(r.status_code == 200 for r in results)
     _first = results[0].json()
     assert all(r.json()["method"] == "GET" for r in results)
     assert created == 1  # only one AsyncClient created
 
 
-@pytest.mark.asyncio
 async def test_context_overrides_isolation_between_tasks() -> None:
     container = Container()
     token = Token("config", str, scope=Scope.REQUEST)
@@ -90,14 +93,13 @@ async def test_context_overrides_isolation_between_tasks() -> None:
     assert res_b == "B"
 
 
-@pytest.mark.asyncio
 async def test_fake_asyncpg_pool_singleton_and_cleanup() -> None:
     container = Container()
     pool_token = Token("db_pool", FakeAsyncPGPool, scope=Scope.SINGLETON)
 
     @asynccontextmanager
     async def pool_cm():
-        await asyncio.sleep(0.001)
+        await asyncio.sleep(0)
         p = FakeAsyncPGPool()
         try:
             yield p
@@ -107,9 +109,12 @@ async def test_fake_asyncpg_pool_singleton_and_cleanup() -> None:
     container.register_context(pool_token, lambda: pool_cm(), is_async=True)
 
     # Concurrency: ensure only one pool is created
-    pools = await asyncio.gather(*(container.aget(pool_token) for _ in range(20)))
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(container.aget(pool_token)) for _ in range(8)]
+    pools = [t.result() for t in tasks]
     first = pools[0]
     assert all(p is first for p in pools)
+    assert not container._inflight  # in-flight slot released once cached
 
     # Simulate a query
     rows = await first.fetch("select 1")
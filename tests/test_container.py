@@ -1,8 +1,15 @@
 """Enhanced singular Container tests (consolidated)."""
 
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from unittest.mock import patch
+
 import pytest
 
 from pyinj.container import Container
+from pyinj.exceptions import ResolutionError
 from pyinj.tokens import Scope, Token
 
 
@@ -22,6 +29,20 @@ class Service:
         self.cache = cache
 
 
+class Closeable:
+    def close(self) -> None:  # pragma: no cover - never invoked
+        pass
+
+
+class PostgresDatabase(Database):
+    pass
+
+
+class Handler:
+    def __call__(self) -> str:  # pragma: no cover - never invoked
+        return "called"
+
+
 class TestContainer:
     def test_container_initialization(self) -> None:
         container = Container()
@@ -44,6 +65,27 @@ class TestContainer:
         assert result is container
         assert len(container.get_providers_view()) == 1
 
+    def test_views_track_later_changes(self) -> None:
+        container = Container()
+        providers = container.get_providers_view()
+        assert container.resources_view() == ()
+
+        @contextmanager
+        def open_db() -> Iterator[Closeable]:
+            yield Closeable()
+
+        token = Token("db", Closeable)
+        container.register_context(
+            token, open_db, is_async=False, scope=Scope.SINGLETON
+        )
+        resource = container.get(token)
+        container.register(Token("cache", Cache), Cache)
+
+        assert container.get_providers_view() is providers
+        assert len(providers) == 1
+        assert container.resources_view() == (resource,)
+        assert container.resources_view() is container.resources_view()
+
     def test_register_with_type(self) -> None:
         container = Container()
 
@@ -69,19 +111,34 @@ class TestContainer:
         with pytest.raises(TypeError):
             container.register(Token("database", Database), "not_callable")  # type: ignore[arg-type]
 
+    def test_transient_provider_revalidated_when_type_changes(self) -> None:
+        container = Container()
+        results: list[object] = [Database(), Database(), Cache()]
+        token = Token("database", Database)
+        container.register(token, lambda: results.pop(0))
+
+        assert isinstance(container.get(token), Database)
+        assert isinstance(container.get(token), Database)
+        with pytest.raises(TypeError):
+            container.get(token)
+
     def test_register_chaining(self) -> None:
-        container = (
-            Container()
-            .register(Token("db", Database), lambda: Database())
-            .register(Token("cache", Cache), lambda: Cache())
-            .register(Token("service", Service), lambda: Service(Database(), Cache()))
+        container = Container()
+        chained = (
+            container.register(Token("db", Database), Database)
+            .register(Token("cache", Cache), Cache)
+            .register(
+                Token("service", Service),
+                lambda: Service(container.get(Database), container.get(Cache)),
+            )
         )
+        assert chained is container
         assert len(container.get_providers_view()) == 3
 
     def test_register_scoped_methods(self) -> None:
         container = Container()
-        container.register_singleton(Database, lambda: Database())
-        container.register_request(Cache, lambda: Cache())
+        container.register_singleton(Database, Database)
+        container.register_request(Cache, Cache)
         container.register_transient(Service, lambda: Service(Database(), Cache()))
         tokens = list(container.get_providers_view().keys())
         assert any(t.scope == Scope.SINGLETON for t in tokens)
@@ -96,6 +153,29 @@ class TestContainer:
         assert stats["singletons"] == 1
         assert container.get(Database) is db_instance
 
+    def test_has_resolves_types_through_index(self) -> None:
+        container = Container()
+        assert container.has(Database) is False
+        container.register_value(Database, Database())
+        container.register_singleton(Cache, Cache)
+        assert container.has(Database) is True
+        assert container.has(Cache) is True
+
+    def test_has_forgets_cleared_values(self) -> None:
+        container = Container()
+        container.register_value(Database, Database())
+        container.register_singleton(Cache, Cache)
+        container.get(Database)
+        container.get(Cache)
+
+        container.clear()
+
+        assert container.has(Database) is False
+        with pytest.raises(ResolutionError):
+            container.get(Database)
+        assert container.has(Cache) is True
+        assert isinstance(container.get(Cache), Cache)
+
     def test_get_simple(self) -> None:
         container = Container()
         db_instance = Database()
@@ -123,6 +203,22 @@ class TestContainer:
         container.given(int, 42)
         assert container.resolve_given(int) == 42
 
+    def test_given_resolves_through_base_classes(self) -> None:
+        container = Container()
+        db = Database()
+        container.given(Database, db)
+        assert container.resolve_given(PostgresDatabase) is db
+
+        replacement = Database()
+        container.given(Database, replacement)
+        assert container.resolve_given(PostgresDatabase) is replacement
+
+    def test_given_callable_instance_is_a_value(self) -> None:
+        container = Container()
+        handler = Handler()
+        container.given(Handler, handler)
+        assert container.resolve_given(Handler) is handler
+
     def test_has_method(self) -> None:
         container = Container()
         assert container.has(Token("unknown", str)) is False
@@ -130,6 +226,56 @@ class TestContainer:
         assert container.has(str) is True
 
 
+class TestThreadSafety:
+    """Test the thread_safe constructor flag."""
+
+    def test_single_threaded_container_registers_and_resolves(self) -> None:
+        container = Container(thread_safe=False)
+        db_token = Token("db", Database, scope=Scope.SINGLETON)
+        cache_token = Token("cache", Cache)
+        container.batch_register([(db_token, Database), (cache_token, Cache)])
+
+        assert container.get(db_token) is container.get(db_token)
+        assert isinstance(container.get(cache_token), Cache)
+        container.clear()
+        assert container.has(db_token)
+
+
+class TestOverrides:
+    """Test scoped overrides via use_overrides."""
+
+    def test_nested_use_overrides_restore_on_exit(self) -> None:
+        container = Container()
+        db_token = Token("db", Database)
+        cache_token = Token("cache", Cache)
+        container.register(db_token, Database)
+        container.register(cache_token, Cache)
+        fake_db = Database()
+        fake_cache = Cache()
+
+        with container.use_overrides({db_token: fake_db}):
+            assert container.get(db_token) is fake_db
+            with container.use_overrides({cache_token: fake_cache}):
+                assert container.get(db_token) is fake_db
+                assert container.get(cache_token) is fake_cache
+            assert container.get(db_token) is fake_db
+            assert container.get(cache_token) is not fake_cache
+
+        assert container.get(db_token) is not fake_db
+
+    def test_override_shadows_cached_singleton(self) -> None:
+        container = Container()
+        db_token = Token("db", Database, scope=Scope.SINGLETON)
+        container.register(db_token, Database)
+        real_db = container.get(db_token)
+        fake_db = Database()
+
+        with container.use_overrides({db_token: fake_db}):
+            assert container.get(db_token) is fake_db
+
+        assert container.get(db_token) is real_db
+
+
 class TestTypeResolution:
     """Test type-based resolution using direct types."""
 
@@ -145,6 +291,17 @@ class TestTypeResolution:
         assert isinstance(resolved, ServiceX)
         assert resolved.value == 42
 
+    def test_type_lookup_follows_later_registration(self):
+        container = Container()
+        container.register(Token("db", Database), Database)
+        assert isinstance(container.get(Database), Database)
+
+        replacement = Database()
+        container.register_value(
+            Token("db_override", Database, scope=Scope.SINGLETON), replacement
+        )
+        assert container.get(Database) is replacement
+
 
 class TestSingletonLocks:
     """Test singleton lock creation and cleanup."""
@@ -223,11 +380,32 @@ class TestSingletonLocks:
         assert instance1 is instance2
         assert TestService.instances_created == 1
 
+    def test_singleton_lock_kept_after_failure_and_dropped_after_success(self):
+        """Test a failed init keeps the lock and the next success drops it."""
+        container = Container()
+        attempts = 0
+
+        def flaky() -> Database:
+            nonlocal attempts
+            attempts += 1
+            if attempts == 1:
+                raise RuntimeError("boom")
+            return Database()
+
+        token = Token("flaky", Database)
+        obj_token = container._obj_token(token)
+        container.register(token, flaky, Scope.SINGLETON)
+
+        with pytest.raises(RuntimeError):
+            container.get(token)
+        assert obj_token in container._singleton_locks
+        assert not container._singleton_locks[obj_token].locked()
+
+        container.get(token)
+        assert obj_token not in container._singleton_locks
+
     def test_singleton_lock_with_concurrent_access(self):
         """Test that singleton lock properly handles concurrent access."""
-        import threading
-        import time
-
         container = Container()
 
         class SlowService:
@@ -328,3 +506,34 @@ class TestSingletonLocks:
         # Clean up the second one
         container._cleanup_singleton_lock(obj_token2)
         assert obj_token2 not in container._singleton_locks
+
+    def test_singleton_none_value_is_cached(self):
+        """A singleton provider returning None is only invoked once."""
+        container = Container()
+        calls = 0
+
+        def provide_nothing() -> None:
+            nonlocal calls
+            calls += 1
+            return None
+
+        token = Token("nothing", object)
+        container.register(token, provide_nothing, Scope.SINGLETON)
+
+        assert container.get(token) is None
+        assert container.get(token) is None
+        assert calls == 1
+        assert container._obj_token(token) not in container._singleton_locks
+
+    def test_idempotent_singleton_skips_lock(self):
+        """Idempotent singleton providers are initialized without a lock."""
+        container = Container()
+        token = Token("config", dict)
+        container.register_singleton(token, lambda: {"env": "test"}, idempotent=True)
+
+        with patch.object(Container, "_get_singleton_lock") as get_lock:
+            first = container.get(token)
+            second = container.get(token)
+
+        assert first is second
+        get_lock.assert_not_called()
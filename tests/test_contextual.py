@@ -1,6 +1,7 @@
 """Tests for contextual scoping implementation."""
 
-from unittest.mock import MagicMock, Mock
+import asyncio
+from unittest.mock import Mock
 
 import pytest
 
@@ -9,6 +10,7 @@ from pyinj.contextual import (
     RequestScope,
     SessionScope,
 )
+from pyinj.exceptions import AsyncCleanupRequiredError
 from pyinj.tokens import Scope, Token
 
 
@@ -28,6 +30,21 @@ class AsyncResource:
         pass
 
 
+class ContextResource:
+    """Context manager recording the arguments its ``__exit__`` received."""
+
+    __slots__ = ("exit_calls",)
+
+    def __init__(self) -> None:
+        self.exit_calls: list[tuple[object, object, object]] = []
+
+    def __enter__(self) -> "ContextResource":
+        return self
+
+    def __exit__(self, exc_type: object, exc: object, tb: object) -> None:
+        self.exit_calls.append((exc_type, exc, tb))
+
+
 class TestContextualContainer:
     """Test suite for ContextualContainer."""
 
@@ -37,7 +54,7 @@ class TestContextualContainer:
 
         # Provider view is only available on Container; ContextualContainer tracks providers internally.
         # Transients are no longer cached (fixed memory leak and correctness issue)
-        assert hasattr(container, "_async_locks")
+        assert hasattr(container, "_resources")
 
     def test_request_scope_context(self):
         """Test request scope context manager."""
@@ -140,18 +157,24 @@ class TestContextualContainer:
     def test_cleanup_with_context_manager(self):
         """Test cleanup of context manager resources."""
         container = ContextualContainer()
-        token = Token("resource", Mock, scope=Scope.REQUEST)
+        token = Token("resource", ContextResource, scope=Scope.REQUEST)
 
-        mock_resource = MagicMock()
+        resource = ContextResource()
 
         with container.request_scope():
-            container.store_in_context(token, mock_resource)
+            container.store_in_context(token, resource)
+
+        assert resource.exit_calls == [(None, None, None)]
+
+    def test_async_only_resource_rejected_by_sync_scope(self):
+        """Async-only resources cannot be released by a sync scope."""
+        container = ContextualContainer()
+        token = Token("resource", AsyncResource, scope=Scope.REQUEST)
 
-        # __exit__ should have been called if it exists
-        if hasattr(mock_resource, "__exit__"):
-            mock_resource.__exit__.assert_called_once_with(None, None, None)
+        with pytest.raises(AsyncCleanupRequiredError):
+            with container.request_scope():
+                container.store_in_context(token, AsyncResource())
 
-    @pytest.mark.asyncio
     async def test_async_request_scope(self):
         """Test async request scope."""
         container = ContextualContainer()
@@ -164,7 +187,6 @@ class TestContextualContainer:
 
         assert container.resolve_from_context(token) is None
 
-    @pytest.mark.asyncio
     async def test_async_cleanup(self):
         """Test async resource cleanup."""
         container = ContextualContainer()
@@ -182,6 +204,27 @@ class TestContextualContainer:
 
         mock_resource.aclose.assert_called_once()
 
+    async def test_async_cleanup_closes_resources_before_cm_exits(self):
+        """Test cached resources finish closing before async cm exits start."""
+        container = ContextualContainer()
+        token = Token("resource", AsyncResource, scope=Scope.REQUEST)
+        events: list[str] = []
+
+        class TrackedResource(AsyncResource):
+            async def aclose(self):
+                events.append("aclose start")
+                await asyncio.sleep(0)
+                events.append("aclose end")
+
+        async def exit_cm() -> None:
+            events.append("aexit")
+
+        async with container.async_request_scope():
+            container.store_in_context(token, TrackedResource())
+            container._register_request_cleanup_async(exit_cm)
+
+        assert events == ["aclose start", "aclose end", "aexit"]
+
     def test_clear_request_context(self):
         """Test clearing request context."""
         container = ContextualContainer()
@@ -242,7 +285,6 @@ class TestRequestScope:
             resolved = scope.resolve(token)
             assert resolved is db
 
-    @pytest.mark.asyncio
     async def test_request_scope_async(self):
         """Test RequestScope async context manager."""
         container = ContextualContainer()
@@ -7,7 +7,7 @@ from concurrent.futures import ThreadPoolExecutor
 import pytest
 
 from pyinj import Container, Scope, Token
-from pyinj.container import _resolution_set, _resolution_stack
+from pyinj.container import _resolution_stack
 from pyinj.exceptions import CircularDependencyError
 
 
@@ -81,8 +81,8 @@ class TestCycleDetection:
                 f"Cycle detection too slow at depth {depth}: {det_time:.4f}s"
             )
 
-    def test_resolution_set_mechanism(self):
-        """Test the internal _resolution_set mechanism for cycle detection."""
+    def test_resolution_stack_mechanism(self):
+        """Test the internal _resolution_stack frames used for cycle detection."""
         container = Container()
 
         # Create services with dependencies
@@ -96,28 +96,29 @@ class TestCycleDetection:
         def create_a():
             resolution_path.append("a")
             # Check that we're being tracked in the resolution set
-            assert token_a in _resolution_set.get(), (
-                "Token A should be in resolution set"
+            assert token_a in _resolution_stack.get(), (
+                "Token A should be on the resolution stack"
             )
             return object()
 
         def create_b():
             resolution_path.append("b")
-            assert token_b in _resolution_set.get(), (
-                "Token B should be in resolution set"
+            assert token_b in _resolution_stack.get(), (
+                "Token B should be on the resolution stack"
             )
             # B depends on C
             return container.get(token_c)
 
         def create_c():
             resolution_path.append("c")
-            assert token_c in _resolution_set.get(), (
-                "Token C should be in resolution set"
-            )
-            # Check all are in the set during nested resolution
-            assert len(_resolution_set.get()) == 3, (
-                "All tokens should be in resolution set"
+            assert token_c in _resolution_stack.get(), (
+                "Token C should be on the resolution stack"
             )
+            # The innermost frame chains back through the whole path
+            frame = _resolution_stack.get()
+            assert frame.token == token_c
+            assert frame.depth == 3, "All tokens should be on the resolution stack"
+            assert list(frame) == [token_a, token_b, token_c]
             return object()
 
         # Register B and C normally
@@ -130,11 +131,8 @@ class TestCycleDetection:
         # Resolve A (which depends on B, which depends on C)
         container.get(token_a)
 
-        # After resolution, sets should be cleared
-        assert len(_resolution_set.get()) == 0, (
-            "Resolution set should be empty after successful resolution"
-        )
-        assert len(_resolution_stack.get()) == 0, (
+        # After resolution, the stack should be unwound
+        assert _resolution_stack.get().depth == 0, (
             "Resolution stack should be empty after successful resolution"
         )
 
@@ -265,9 +263,9 @@ class TestCycleDetection:
 
         assert "Circular dependency detected" in str(exc.value)
 
-        # Resolution set should be cleared after exception
-        assert len(_resolution_set.get()) == 0, (
-            "Resolution set should be cleared after async exception"
+        # Resolution stack should be unwound after exception
+        assert _resolution_stack.get().depth == 0, (
+            "Resolution stack should be cleared after async exception"
         )
 
     def test_self_dependency_detection(self):
@@ -367,10 +365,7 @@ class TestCycleDetection:
         with pytest.raises(ValueError, match="Intentional failure"):
             container.get(token)
 
-        # Resolution set should be cleaned up even after non-cycle exception
-        assert len(_resolution_set.get()) == 0, (
-            "Resolution set should be cleared after exception"
-        )
-        assert len(_resolution_stack.get()) == 0, (
+        # Resolution stack should be unwound even after non-cycle exception
+        assert _resolution_stack.get().depth == 0, (
             "Resolution stack should be cleared after exception"
         )
@@ -1,5 +1,7 @@
 """Tests for injection decorators and dependency resolution."""
 
+import asyncio
+import inspect
 from typing import Any, Callable, cast
 from unittest.mock import Mock, patch
 
@@ -40,6 +42,21 @@ class Service:
         self.cache = cache
 
 
+class AsyncStubContainer:
+    """Minimal resolver whose ``aget`` returns a fixed instance.
+
+    Cheaper than a ``Mock`` for tests that never inspect calls.
+    """
+
+    __slots__ = ("instance",)
+
+    def __init__(self, instance: object) -> None:
+        self.instance = instance
+
+    async def aget(self, token: object) -> object:
+        return self.instance
+
+
 class TestInjectMarker:
     """Test suite for Inject marker class."""
 
@@ -183,8 +200,6 @@ class TestAnalyzeDependencies:
         def mock_signature(func: Callable[..., object]):
             nonlocal call_count
             call_count += 1
-            import inspect
-
             return inspect.signature(func)
 
         def handler(db: Inject[Database]) -> object:
@@ -284,17 +299,10 @@ class TestResolveDependencies:
         # cache should be resolved from container
         container.get.assert_called_once()  # Only for cache
 
-    @pytest.mark.asyncio
     async def test_resolve_async(self):
         """Test async dependency resolution."""
-        container = Mock()
         db_instance = Database()
-
-        # Mock aget method
-        async def mock_aget(token: object):
-            return db_instance
-
-        container.aget = mock_aget
+        container = AsyncStubContainer(db_instance)
 
         token = Token("database", Database)
         deps = cast(dict[str, DependencyRequest], {"db": token})
@@ -303,7 +311,6 @@ class TestResolveDependencies:
 
         assert resolved["db"] is db_instance
 
-    @pytest.mark.asyncio
     async def test_resolve_async_with_sync_fallback(self):
         """Test async resolution falls back to sync."""
         container = Mock()
@@ -319,7 +326,6 @@ class TestResolveDependencies:
         assert resolved["db"] is db_instance
         container.get.assert_called_once_with(token)
 
-    @pytest.mark.asyncio
     async def test_resolve_async_provider(self):
         """Test async provider resolution."""
         container = Mock()
@@ -335,6 +341,47 @@ class TestResolveDependencies:
 
         assert resolved["db"] is db_instance
 
+    async def test_resolve_async_sync_provider_inline(self):
+        """Test sync providers resolve inline, including awaitable results."""
+        container = Mock()
+        db_instance = Database()
+        cache_instance = Cache()
+
+        async def make_cache():
+            return cache_instance
+
+        deps: dict[str, DependencyRequest] = {
+            "db": Inject(lambda: db_instance),
+            "cache": Inject(lambda: make_cache()),
+        }
+
+        resolved = await resolve_dependencies_async(deps, container)
+
+        assert resolved["db"] is db_instance
+        assert resolved["cache"] is cache_instance
+
+    async def test_resolve_async_inline_failure_cancels_started_tasks(self):
+        """Test a failing inline provider cancels dependencies already started."""
+        container = Mock()
+
+        async def slow_db() -> Database:
+            await asyncio.sleep(3600)
+            return Database()
+
+        def broken_cache() -> Cache:
+            raise RuntimeError("cache unavailable")
+
+        deps: dict[str, DependencyRequest] = {
+            "db": Inject(slow_db),
+            "cache": Inject(broken_cache),
+        }
+        before = asyncio.all_tasks()
+
+        with pytest.raises(RuntimeError, match="cache unavailable"):
+            await resolve_dependencies_async(deps, container)
+
+        assert asyncio.all_tasks() - before == set()
+
 
 class TestInjectDecorator:
     """Test suite for @inject decorator."""
@@ -355,6 +402,20 @@ class TestInjectDecorator:
         assert result[1] == "test"
         container.get.assert_called_once()
 
+    def test_inject_binds_positional_args_around_injected(self):
+        """Test positional args skip over injected parameters."""
+        container = Mock()
+        db_instance = Database()
+        container.get.return_value = db_instance
+
+        @inject(container=container)
+        def handler(first: int, db: Inject[Database], second: int):
+            return (first, db, second)
+
+        result = cast(Callable[..., Any], handler)(1, 2)
+
+        assert result == (1, db_instance, 2)
+
     def test_inject_no_dependencies(self):
         """Test @inject with no dependencies."""
 
@@ -365,6 +426,14 @@ class TestInjectDecorator:
         result = handler(1, 2)
         assert result == 3
 
+    def test_inject_no_dependencies_returns_function_unwrapped(self):
+        """Test @inject leaves functions without dependencies untouched."""
+
+        def handler(x: int, y: int):
+            return x + y
+
+        assert inject(handler) is handler
+
     def test_inject_with_override(self):
         """Test @inject with parameter override."""
         container = Mock()
@@ -384,16 +453,10 @@ class TestInjectDecorator:
         result2 = cast(Callable[..., Any], handler)(db=override_db)
         assert result2 is override_db
 
-    @pytest.mark.asyncio
     async def test_inject_async_function(self):
         """Test @inject on async function."""
-        container = Mock()
         db_instance = Database()
-
-        async def mock_aget(token: object):
-            return db_instance
-
-        container.aget = mock_aget
+        container = AsyncStubContainer(db_instance)
 
         @inject(container=container)
         async def handler(db: Inject[Database]):
@@ -417,6 +480,23 @@ class TestInjectDecorator:
             assert isinstance(result, Database)
             mock_get.assert_called_once()
 
+    def test_inject_follows_default_container_changes(self):
+        """Test @inject without a container resolves from the current default."""
+        first = Mock()
+        first.get.return_value = Database()
+        second = Mock()
+        second.get.return_value = Database()
+
+        @inject
+        def handler(db: Inject[Database]):
+            return db
+
+        with patch("pyinj.injection.get_default_container") as mock_get:
+            mock_get.return_value = first
+            assert cast(Callable[[], Any], handler)() is first.get.return_value
+            mock_get.return_value = second
+            assert cast(Callable[[], Any], handler)() is second.get.return_value
+
     def test_inject_preserves_function_metadata(self):
         """Test @inject preserves function metadata."""
 
@@ -6,8 +6,10 @@ from typing import Annotated, Awaitable, Callable, Optional, cast
 import pytest
 
 from pyinj.container import Container
+from pyinj.exceptions import CircularDependencyError, ResolutionError
 from pyinj.injection import Inject, inject
 from pyinj.tokens import Token
+from pyinj.types import ProviderLike
 
 
 # Test domain classes
@@ -207,7 +209,6 @@ class TestCompleteIntegration:
             assert cache3.get("key1") is None  # New cache instance
             assert cache3 is not cache1
 
-    @pytest.mark.asyncio
     async def test_async_integration(self):
         """Test async dependency resolution."""
         container = Container()
@@ -227,7 +228,6 @@ class TestCompleteIntegration:
         db2 = await container.aget(Database)
         assert db is db2
 
-    @pytest.mark.asyncio
     async def test_async_inject_integration(self):
         """Test async @inject decorator."""
         container = Container()
@@ -244,8 +244,6 @@ class TestCompleteIntegration:
         container.register(Database, create_db)
         container.register(Cache, create_cache)
 
-        from typing import Annotated
-
         @inject(container=container)
         async def async_handler(
             db: Annotated[Database, Inject()],
@@ -267,8 +265,6 @@ class TestCompleteIntegration:
         container = Container()
 
         # Batch register
-        from typing import cast
-
         registrations = [
             (
                 container.tokens.singleton("db_config", DatabaseConfig),
@@ -279,8 +275,6 @@ class TestCompleteIntegration:
                 lambda: CacheConfig(),
             ),
         ]
-        from pyinj.types import ProviderLike
-
         container.batch_register(
             cast(list[tuple[Token[object], ProviderLike[object]]], registrations)
         )
@@ -315,8 +309,6 @@ class TestCompleteIntegration:
         container = Container()
 
         # Unregistered dependency
-        from pyinj.exceptions import ResolutionError
-
         with pytest.raises(ResolutionError) as exc_info:
             container.get(Database)
 
@@ -344,7 +336,5 @@ class TestCompleteIntegration:
         container.register(token_a, create_a)
         container.register(token_b, create_b)
 
-        from pyinj.exceptions import CircularDependencyError
-
         with pytest.raises(CircularDependencyError):
             container.get(token_a)
@@ -7,6 +7,7 @@ import weakref
 import pytest
 
 from pyinj import Container, Scope, Token
+from pyinj.container import _resolution_stack
 
 
 class TestMemoryProfiling:
@@ -273,8 +274,8 @@ class TestMemoryProfiling:
             f"Cleanup not in LIFO order: {cleanup_called}"
         )
 
-    def test_resolution_set_memory_efficiency(self):
-        """Test that the new _resolution_set for O(1) cycle detection is memory efficient."""
+    def test_resolution_stack_memory_efficiency(self):
+        """Test that the _resolution_stack frames for cycle detection are memory efficient."""
         container = Container()
 
         # Create a simpler dependency chain to avoid deep recursion
@@ -313,14 +314,9 @@ class TestMemoryProfiling:
         tracemalloc.stop()
 
         # The resolution stack should be cleared after resolution
-        from pyinj.container import _resolution_set, _resolution_stack
-
-        assert len(_resolution_stack.get()) == 0, (
+        assert _resolution_stack.get().depth == 0, (
             "Resolution stack should be empty after resolution"
         )
-        assert len(_resolution_set.get()) == 0, (
-            "Resolution set should be empty after resolution"
-        )
 
         # Memory growth should be reasonable (not keeping the entire chain in memory)
         stats = snapshot_after.compare_to(snapshot_before, "lineno")
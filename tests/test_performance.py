@@ -1,6 +1,10 @@
 """Performance and O(1) lookup verification tests."""
 
+import gc
+import sys
 import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import pytest
@@ -209,8 +213,6 @@ class TestPerformance:
 
     def test_memory_efficiency(self):
         """Test that container doesn't use excessive memory."""
-        import sys
-
         container = Container()
 
         # Measure initial memory usage using public views
@@ -253,8 +255,6 @@ class TestPerformance:
     @pytest.mark.slow
     def test_stress_performance(self):
         """Stress test with many concurrent operations."""
-        from concurrent.futures import ThreadPoolExecutor
-
         container = Container()
 
         # Pre-register services
@@ -481,9 +481,6 @@ class TestPerformance:
 
     def test_memory_efficiency_with_tracemalloc(self):
         """Test memory efficiency using tracemalloc for accurate profiling."""
-        import gc
-        import tracemalloc
-
         tracemalloc.start()
 
         # Take initial snapshot
@@ -3,6 +3,7 @@
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from typing import Any
 
 # no direct pytest usage in this module
@@ -184,7 +185,6 @@ class TestThreadSafety:
 
         def create_and_get_resource(resource_id: str) -> CloseableResource:
             token = Token(f"resource_{resource_id}", CloseableResource)
-            from contextlib import contextmanager
 
             @contextmanager
             def cm():